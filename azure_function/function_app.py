@@ -8,14 +8,21 @@ import json
 import asyncio
 import logging
 import os
+import re
 import sys
+import time
+import gzip
+import hashlib
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional
 
-# Add the parent directory to Python path to import MCP server
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import msgspec
+import orjson
 
-from src.ethekwini_gis_mcp import EThekwiniGISServer
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,36 +31,266 @@ logger = logging.getLogger("ethekwini-gis-function")
 # Initialize the function app with v2 programming model
 app = func.FunctionApp(http_auth_level=func.AuthLevel.FUNCTION)
 
-# Global server instance (initialized on first request)
-_server_instance: Optional[EThekwiniGISServer] = None
+# Global server instance (initialized on first request); the server class is
+# imported lazily in get_server_instance to keep it off the cold-start path
+_server_instance: Optional["EThekwiniGISServer"] = None
 
-async def get_server_instance() -> EThekwiniGISServer:
-    """Get or create server instance with lazy initialization"""
-    global _server_instance
-    if _server_instance is None:
-        logger.info("Initializing eThekwini GIS server...")
-        _server_instance = EThekwiniGISServer()
+# Optional pre-built dataset snapshot shipped with the deployment package.
+# Loading it locally avoids blocking the first request on an ArcGIS round-trip.
+_SNAPSHOT_PATH = os.getenv(
+    "ETHEKWINI_DATASETS_SNAPSHOT",
+    os.path.join(os.path.dirname(__file__), "datasets_snapshot.json")
+)
+
+def _load_datasets_snapshot() -> Optional[Dict[str, Any]]:
+    """Load the pre-built dataset snapshot if one was shipped with the app"""
+    try:
+        with open(_SNAPSHOT_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not load datasets snapshot: {e}")
+        return None
+
+# Single-flight initialization: concurrent first requests all await the same
+# task instead of racing to build their own server and duplicate the refresh
+_init_lock = asyncio.Lock()
+_init_task: Optional[asyncio.Task] = None
+
+# Background snapshot refresh; kept referenced so the event loop cannot
+# garbage-collect the task before it finishes
+_snapshot_refresh_task: Optional[asyncio.Task] = None
+
+async def _refresh_snapshot(server: "EThekwiniGISServer") -> None:
+    """Refresh the live cache, then swap it in over the build-time snapshot.
+
+    The refresh writes cached_datasets (dataclass records); the endpoints
+    read the dict-shaped server.datasets, so the records are converted back
+    to the snapshot format before the swap."""
+    from dataclasses import asdict
+    try:
+        await server._refresh_datasets()
+        if server.cached_datasets:
+            server.datasets = {dataset_id: asdict(record)
+                               for dataset_id, record in server.cached_datasets.items()}
+            logger.info(f"Snapshot replaced with {len(server.datasets)} refreshed datasets")
+    except Exception as e:
+        logger.warning(f"Background snapshot refresh failed: {e}")
+
+async def _build_server() -> "EThekwiniGISServer":
+    """Construct and warm the server instance (runs exactly once)"""
+    global _server_instance, _snapshot_refresh_task
+    logger.info("Initializing eThekwini GIS server...")
+    # Import here so worker cold start doesn't pay for the MCP server
+    # module (httpx, mcp, etc.) before the first request needs it
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+    from src.ethekwini_gis_mcp import EThekwiniGISServer
+
+    server = EThekwiniGISServer()
+    snapshot = _load_datasets_snapshot()
+    if snapshot is not None:
+        # Serve from the snapshot immediately and refresh in the background
+        # so the first request never waits on the ArcGIS fan-out
+        server.datasets = snapshot
+        logger.info(f"Loaded {len(snapshot)} datasets from snapshot")
+        _snapshot_refresh_task = asyncio.create_task(_refresh_snapshot(server))
+    else:
         # Pre-warm the datasets cache
         try:
-            await _server_instance._refresh_datasets()
-            logger.info(f"Server initialized with {len(_server_instance.datasets)} datasets")
+            await server._refresh_datasets()
+            logger.info(f"Server initialized with {len(server.datasets)} datasets")
         except Exception as e:
             logger.error(f"Failed to initialize datasets: {e}")
-    return _server_instance
+    _server_instance = server
+    return server
+
+async def get_server_instance() -> "EThekwiniGISServer":
+    """Get or create server instance with lazy initialization"""
+    global _init_task
+    if _init_task is None:
+        async with _init_lock:
+            if _init_task is None:
+                _init_task = asyncio.create_task(_build_server())
+    return await _init_task
+
+# Pretty-printed JSON is handy during development but adds ~30% to the bytes
+# moved on large payloads, so it is opt-in via environment variable
+_PRETTY_JSON = os.getenv("ETHEKWINI_PRETTY_JSON", "false").lower() == "true"
+
+# CORS headers are identical for every response, so build the dicts once at
+# import time instead of allocating them per request
+_CORS_HEADERS = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization, X-Requested-With"
+}
+
+_CORS_PREFLIGHT_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization, X-Requested-With",
+    "Access-Control-Max-Age": "3600"
+}
+
+# Response timestamps have 1-second resolution anyway, so cache the formatted
+# string and only rebuild it when the clock ticks over
+_ts_cache = {"second": 0, "iso": ""}
+
+def now_iso() -> str:
+    """Current UTC time as an ISO string, cached per second"""
+    second = int(time.time())
+    if second != _ts_cache["second"]:
+        _ts_cache["iso"] = datetime.utcfromtimestamp(second).isoformat()
+        _ts_cache["second"] = second
+    return _ts_cache["iso"]
+
+def _json_default(value: Any) -> str:
+    """Fallback encoder for types orjson does not handle natively"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+# Search index over the dataset cache: lowercased names plus a token ->
+# dataset-id inverted index, rebuilt whenever the cache dict is replaced.
+# Keeps list_datasets from re-lowercasing every name on every request.
+_dataset_index: Dict[str, Any] = {"datasets": None, "name_lower": {}, "tokens": {}}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+class QueryBody(msgspec.Struct):
+    """Request body for POST /datasets/{id}/query"""
+    where: str = '1=1'
+    max_records: int = 10
+    fields: str = '*'
+    stream: bool = False
+
+class SpatialBody(msgspec.Struct):
+    """Request body for POST /datasets/{id}/spatial"""
+    geometry: Any = None
+    spatial_rel: str = 'esriSpatialRelIntersects'
+    max_records: int = 10
+
+class SearchBody(msgspec.Struct):
+    """Request body for POST /search"""
+    search_term: str = ''
+
+class DatasetRow(msgspec.Struct):
+    """Summary row returned by the /datasets listing"""
+    id: str
+    name: str
+    description: str
+    geometry_type: str
+    max_record_count: int
 
-def create_response(data: Any, status_code: int = 200) -> func.HttpResponse:
+def _format_dataset_row(dataset_id: str, dataset_info: Dict[str, Any]) -> DatasetRow:
+    """Build the summary row returned by the /datasets listing"""
+    return DatasetRow(
+        id=dataset_id,
+        name=dataset_info.get('name', 'Unknown'),
+        description=dataset_info.get('description', ''),
+        geometry_type=dataset_info.get('geometryType', 'Unknown'),
+        max_record_count=dataset_info.get('maxRecordCount', 1000)
+    )
+
+def _encode_listing(rows: list) -> bytes:
+    """Encode a /datasets listing payload straight from the row structs"""
+    body = msgspec.json.encode({
+        "datasets": rows,
+        "total_count": len(rows),
+        "timestamp": now_iso()
+    })
+    if _PRETTY_JSON:
+        body = msgspec.json.format(body, indent=2)
+    return body
+
+def _get_dataset_index(server: "EThekwiniGISServer") -> Dict[str, Any]:
+    """Return the search index, rebuilding it if the dataset cache changed"""
+    if _dataset_index["datasets"] is not server.datasets:
+        name_lower = {}
+        tokens: Dict[str, set] = {}
+        rows = {}
+        for dataset_id, dataset_info in server.datasets.items():
+            # Snapshot records serialized from DatasetInfo carry the
+            # precomputed name_lower field; fall back to lowering here for
+            # snapshots that predate it
+            lowered = dataset_info.get('name_lower') or dataset_info.get('name', '').lower()
+            name_lower[dataset_id] = lowered
+            for token in _TOKEN_RE.findall(lowered):
+                tokens.setdefault(token, set()).add(dataset_id)
+            rows[dataset_id] = _format_dataset_row(dataset_id, dataset_info)
+        _dataset_index["name_lower"] = name_lower
+        _dataset_index["tokens"] = tokens
+        _dataset_index["rows"] = rows
+        # Pre-serialize the unfiltered /datasets payload so the common case
+        # is a cached-bytes write instead of a rebuild + re-dump per request
+        list_bytes = _encode_listing(list(rows.values()))
+        _dataset_index["list_bytes"] = list_bytes
+        _dataset_index["etag"] = '"%s"' % hashlib.blake2b(list_bytes, digest_size=8).hexdigest()
+        _dataset_index.pop("list_bytes_br", None)
+        _dataset_index.pop("list_bytes_gz", None)
+        _dataset_index["datasets"] = server.datasets
+    return _dataset_index
+
+# Payloads smaller than this aren't worth the compression round trip
+_MIN_COMPRESS_SIZE = 1024
+
+def _compress_body(req: Optional[func.HttpRequest], body: bytes,
+                   headers: Dict[str, str]) -> tuple:
+    """Compress a response body if the client accepts it and it is big enough.
+
+    Brotli quality 4 / gzip level 1 keep CPU cost negligible while still
+    shrinking the key-heavy JSON payloads ~5-10x.
+    """
+    if req is None or len(body) < _MIN_COMPRESS_SIZE:
+        return body, headers
+    accept = req.headers.get('Accept-Encoding', '')
+    if brotli is not None and 'br' in accept:
+        return brotli.compress(body, quality=4), {**headers, "Content-Encoding": "br"}
+    if 'gzip' in accept:
+        return gzip.compress(body, compresslevel=1), {**headers, "Content-Encoding": "gzip"}
+    return body, headers
+
+def create_response(data: Any, status_code: int = 200,
+                    req: Optional[func.HttpRequest] = None) -> func.HttpResponse:
     """Create standardized HTTP response with CORS headers"""
+    try:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if _PRETTY_JSON:
+            options |= orjson.OPT_INDENT_2
+        body = orjson.dumps(data, default=_json_default, option=options)
+    except (TypeError, orjson.JSONEncodeError):
+        # Fall back to the stdlib encoder for anything orjson rejects
+        body = json.dumps(data, indent=2, default=str).encode()
+    body, headers = _compress_body(req, body, _CORS_HEADERS)
     return func.HttpResponse(
-        json.dumps(data, indent=2, default=str),
+        body,
         status_code=status_code,
-        headers={
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type, Authorization, X-Requested-With"
-        }
+        headers=headers
     )
 
+def dataset_endpoint(fn):
+    """Wrap a dataset-scoped handler with the shared preamble: resolve the
+    server instance, validate the dataset_id route param, and apply standard
+    response and error handling"""
+    async def wrapper(req: func.HttpRequest) -> func.HttpResponse:
+        try:
+            server = await get_server_instance()
+            dataset_id = req.route_params.get('dataset_id')
+            if not dataset_id:
+                return create_response({"error": "Dataset ID is required"}, 400)
+            result = await fn(req, server, dataset_id)
+            if isinstance(result, func.HttpResponse):
+                return result
+            return create_response(result, req=req)
+        except Exception as e:
+            return handle_error(e, fn.__name__)
+    # Keep the original name for logging without copying the signature
+    # (the Functions runtime binds the wrapper's (req) signature)
+    wrapper.__name__ = fn.__name__
+    return wrapper
+
 def handle_error(error: Exception, context: str) -> func.HttpResponse:
     """Handle errors consistently with proper logging"""
     error_msg = str(error)
@@ -61,7 +298,7 @@ def handle_error(error: Exception, context: str) -> func.HttpResponse:
     return create_response({
         "error": error_msg,
         "context": context,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": now_iso(),
         "status": "error"
     }, 500)
 
@@ -74,7 +311,7 @@ async def health_check(req: func.HttpRequest) -> func.HttpResponse:
         server = await get_server_instance()
         return create_response({
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "datasets_count": len(server.datasets),
             "version": "1.0.0"
         })
@@ -92,119 +329,136 @@ async def list_datasets(req: func.HttpRequest) -> func.HttpResponse:
         # Get query parameters
         category = req.params.get('category')
         search = req.params.get('search')
-        
+
+        index = _get_dataset_index(server)
+        name_lower = index["name_lower"]
+        rows = index["rows"]
+
+        # Exact-id fast path: a search term that names a dataset id returns
+        # just that entry without scanning the whole cache
+        if search and not category and search in rows:
+            body, headers = _compress_body(req, _encode_listing([rows[search]]), _CORS_HEADERS)
+            return func.HttpResponse(body, status_code=200, headers=headers)
+
+        # Unfiltered listing: serve the pre-serialized payload, with 304
+        # support so unchanged caches cost the client nothing
+        if not category and not search:
+            if req.headers.get('If-None-Match') == index["etag"]:
+                return func.HttpResponse("", status_code=304,
+                                         headers={**_CORS_HEADERS, "ETag": index["etag"]})
+            # Compressed variants are memoized next to the plain bytes and
+            # dropped together with them on the next index rebuild
+            headers = {**_CORS_HEADERS, "ETag": index["etag"]}
+            accept = req.headers.get('Accept-Encoding', '')
+            if brotli is not None and 'br' in accept:
+                if "list_bytes_br" not in index:
+                    index["list_bytes_br"] = brotli.compress(index["list_bytes"], quality=4)
+                return func.HttpResponse(index["list_bytes_br"], status_code=200,
+                                         headers={**headers, "Content-Encoding": "br"})
+            if 'gzip' in accept:
+                if "list_bytes_gz" not in index:
+                    index["list_bytes_gz"] = gzip.compress(index["list_bytes"], compresslevel=1)
+                return func.HttpResponse(index["list_bytes_gz"], status_code=200,
+                                         headers={**headers, "Content-Encoding": "gzip"})
+            return func.HttpResponse(index["list_bytes"], status_code=200, headers=headers)
+
+        # Candidate ids: a whole-word search hits the inverted index directly
+        # (O(matches)); anything else falls back to the substring scan
+        candidate_ids = server.datasets.keys()
+        if search:
+            search = search.lower()
+            if search in index["tokens"]:
+                candidate_ids = index["tokens"][search]
+        if category:
+            category = category.lower()
+
         datasets = []
-        for dataset_id, dataset_info in server.datasets.items():
-            # Apply filters
-            if category and category.lower() not in dataset_info.get('name', '').lower():
+        for dataset_id in candidate_ids:
+            # Apply filters against the precomputed lowercase names
+            if category and category not in name_lower[dataset_id]:
                 continue
-            if search and search.lower() not in dataset_info.get('name', '').lower():
+            if search and search not in name_lower[dataset_id]:
                 continue
-                
-            datasets.append({
-                "id": dataset_id,
-                "name": dataset_info.get('name', 'Unknown'),
-                "description": dataset_info.get('description', ''),
-                "geometry_type": dataset_info.get('geometryType', 'Unknown'),
-                "max_record_count": dataset_info.get('maxRecordCount', 1000)
-            })
-        
-        return create_response({
-            "datasets": datasets,
-            "total_count": len(datasets),
-            "timestamp": datetime.utcnow().isoformat()
-        })
+
+            datasets.append(rows[dataset_id])
+
+        body, headers = _compress_body(req, _encode_listing(datasets), _CORS_HEADERS)
+        return func.HttpResponse(body, status_code=200, headers=headers)
     except Exception as e:
         return handle_error(e, "list_datasets")
 
 # Get dataset information
 @app.function_name("dataset_info")
 @app.route(route="datasets/{dataset_id}/info", methods=["GET"])
-async def get_dataset_info(req: func.HttpRequest) -> func.HttpResponse:
+@dataset_endpoint
+async def get_dataset_info(req: func.HttpRequest, server: "EThekwiniGISServer",
+                           dataset_id: str) -> Dict[str, Any]:
     """Get detailed information about a specific dataset"""
-    try:
-        server = await get_server_instance()
-        dataset_id = req.route_params.get('dataset_id')
-        
-        if not dataset_id:
-            return create_response({"error": "Dataset ID is required"}, 400)
-        
-        # Call the MCP tool
-        result = await server.get_dataset_info(dataset_id)
-        
-        return create_response({
-            "dataset_info": result,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-    except Exception as e:
-        return handle_error(e, "get_dataset_info")
+    result = await server.get_dataset_info(dataset_id)
+    return {
+        "dataset_info": result,
+        "timestamp": now_iso()
+    }
 
 # Query dataset data
 @app.function_name("query_dataset")
 @app.route(route="datasets/{dataset_id}/query", methods=["POST"])
-async def query_dataset(req: func.HttpRequest) -> func.HttpResponse:
+@dataset_endpoint
+async def query_dataset(req: func.HttpRequest, server: "EThekwiniGISServer",
+                        dataset_id: str) -> Any:
     """Query data from a specific dataset"""
+    # Decode the body straight into a struct; an empty or malformed body
+    # falls back to the defaults, matching the old dict.get behavior
     try:
-        server = await get_server_instance()
-        dataset_id = req.route_params.get('dataset_id')
-        
-        if not dataset_id:
-            return create_response({"error": "Dataset ID is required"}, 400)
-        
-        # Parse request body
-        try:
-            req_body = req.get_json()
-        except ValueError:
-            req_body = {}
-        
-        where_clause = req_body.get('where', '1=1')
-        max_records = req_body.get('max_records', 10)
-        fields = req_body.get('fields', '*')
-        
-        # Call the MCP tool
-        result = await server.query_dataset(dataset_id, where_clause, max_records, fields)
-        
-        return create_response({
-            "query_result": result,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-    except Exception as e:
-        return handle_error(e, "query_dataset")
+        body = msgspec.json.decode(req.get_body() or b'{}', type=QueryBody)
+    except (msgspec.DecodeError, msgspec.ValidationError):
+        body = QueryBody()
+    stream = body.stream
+
+    # Call the MCP tool
+    result = await server.query_dataset(dataset_id, body.where, body.max_records, body.fields)
+
+    if stream and isinstance(result, dict):
+        # NDJSON: one feature per line, each encoded independently, so
+        # large result sets never pass through one giant json.dumps and
+        # clients can parse line by line as bytes arrive
+        body = b"".join(
+            orjson.dumps(feature, default=_json_default) + b"\n"
+            for feature in result.get('features', [])
+        )
+        return func.HttpResponse(
+            body,
+            status_code=200,
+            headers={**_CORS_HEADERS, "Content-Type": "application/x-ndjson"}
+        )
+
+    return {
+        "query_result": result,
+        "timestamp": now_iso()
+    }
 
 # Spatial query endpoint
 @app.function_name("spatial_query")
 @app.route(route="datasets/{dataset_id}/spatial", methods=["POST"])
-async def spatial_query(req: func.HttpRequest) -> func.HttpResponse:
+@dataset_endpoint
+async def spatial_query(req: func.HttpRequest, server: "EThekwiniGISServer",
+                        dataset_id: str) -> Any:
     """Perform spatial query on a dataset"""
     try:
-        server = await get_server_instance()
-        dataset_id = req.route_params.get('dataset_id')
-        
-        if not dataset_id:
-            return create_response({"error": "Dataset ID is required"}, 400)
-        
-        # Parse request body
-        try:
-            req_body = req.get_json()
-        except ValueError:
-            return create_response({"error": "Invalid JSON in request body"}, 400)
-        
-        geometry = req_body.get('geometry')
-        spatial_rel = req_body.get('spatial_rel', 'esriSpatialRelIntersects')
-        max_records = req_body.get('max_records', 10)
-        
-        if not geometry:
-            return create_response({"error": "Geometry is required for spatial query"}, 400)
-        
-        # Call the MCP tool
-        result = await server.spatial_query(dataset_id, geometry, spatial_rel, max_records)
-        
-        return create_response({
-            "spatial_result": result,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-    except Exception as e:
-        return handle_error(e, "spatial_query")
+        body = msgspec.json.decode(req.get_body() or b'', type=SpatialBody)
+    except (msgspec.DecodeError, msgspec.ValidationError):
+        return create_response({"error": "Invalid JSON in request body"}, 400)
+
+    if not body.geometry:
+        return create_response({"error": "Geometry is required for spatial query"}, 400)
+
+    # Call the MCP tool
+    result = await server.spatial_query(dataset_id, body.geometry, body.spatial_rel, body.max_records)
+
+    return {
+        "spatial_result": result,
+        "timestamp": now_iso()
+    }
 
 # Search datasets
 @app.function_name("search_datasets")
@@ -218,8 +472,11 @@ async def search_datasets(req: func.HttpRequest) -> func.HttpResponse:
         if req.method == "GET":
             search_term = req.params.get('q', '')
         else:
-            req_body = req.get_json() or {}
-            search_term = req_body.get('search_term', req.params.get('q', ''))
+            try:
+                body = msgspec.json.decode(req.get_body() or b'{}', type=SearchBody)
+            except (msgspec.DecodeError, msgspec.ValidationError):
+                body = SearchBody()
+            search_term = body.search_term or req.params.get('q', '')
         
         if not search_term:
             return create_response({"error": "Search term is required"}, 400)
@@ -230,7 +487,7 @@ async def search_datasets(req: func.HttpRequest) -> func.HttpResponse:
         return create_response({
             "search_results": result,
             "search_term": search_term,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso()
         })
     except Exception as e:
         return handle_error(e, "search_datasets")
@@ -238,24 +495,15 @@ async def search_datasets(req: func.HttpRequest) -> func.HttpResponse:
 # Get dataset statistics
 @app.function_name("dataset_stats")
 @app.route(route="datasets/{dataset_id}/stats", methods=["GET"])
-async def get_dataset_statistics(req: func.HttpRequest) -> func.HttpResponse:
+@dataset_endpoint
+async def get_dataset_statistics(req: func.HttpRequest, server: "EThekwiniGISServer",
+                                 dataset_id: str) -> Dict[str, Any]:
     """Get statistical information about a dataset"""
-    try:
-        server = await get_server_instance()
-        dataset_id = req.route_params.get('dataset_id')
-        
-        if not dataset_id:
-            return create_response({"error": "Dataset ID is required"}, 400)
-        
-        # Call the MCP tool
-        result = await server.get_dataset_statistics(dataset_id)
-        
-        return create_response({
-            "statistics": result,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-    except Exception as e:
-        return handle_error(e, "get_dataset_statistics")
+    result = await server.get_dataset_statistics(dataset_id)
+    return {
+        "statistics": result,
+        "timestamp": now_iso()
+    }
 
 # Refresh datasets cache
 @app.function_name("refresh_datasets")
@@ -270,7 +518,7 @@ async def refresh_datasets(req: func.HttpRequest) -> func.HttpResponse:
         
         return create_response({
             "refresh_result": result,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso()
         })
     except Exception as e:
         return handle_error(e, "refresh_datasets")
@@ -283,40 +531,34 @@ async def handle_cors(req: func.HttpRequest) -> func.HttpResponse:
     return func.HttpResponse(
         "",
         status_code=204,
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type, Authorization, X-Requested-With",
-            "Access-Control-Max-Age": "3600"
-        }
+        headers=_CORS_PREFLIGHT_HEADERS
     )
 
+# API documentation payload is static, so serialize it once at import time
+_API_DOCS_BYTES = orjson.dumps({
+    "name": "eThekwini GIS MCP API",
+    "version": "1.0.0",
+    "description": "REST API for accessing eThekwini municipality GIS datasets",
+    "endpoints": {
+        "GET /health": "Health check",
+        "GET /datasets": "List all datasets (supports ?category and ?search filters)",
+        "GET /datasets/{id}/info": "Get dataset information",
+        "POST /datasets/{id}/query": "Query dataset data",
+        "POST /datasets/{id}/spatial": "Spatial query on dataset",
+        "GET|POST /search": "Search datasets by keyword",
+        "GET /datasets/{id}/stats": "Get dataset statistics",
+        "POST /admin/refresh": "Refresh datasets cache"
+    },
+    "example_usage": {
+        "list_datasets": "GET /datasets?category=transport",
+        "query_data": "POST /datasets/11/query with JSON body: {'where': 'STATUS=1', 'max_records': 20}",
+        "spatial_query": "POST /datasets/11/spatial with JSON body: {'geometry': {...}, 'spatial_rel': 'esriSpatialRelWithin'}"
+    }
+}, option=orjson.OPT_INDENT_2 if _PRETTY_JSON else 0)
+
 # API documentation endpoint
 @app.function_name("api_docs")
 @app.route(route="", methods=["GET"])
 async def api_documentation(req: func.HttpRequest) -> func.HttpResponse:
     """API documentation and available endpoints"""
-    
-    docs = {
-        "name": "eThekwini GIS MCP API",
-        "version": "1.0.0",
-        "description": "REST API for accessing eThekwini municipality GIS datasets",
-        "endpoints": {
-            "GET /health": "Health check",
-            "GET /datasets": "List all datasets (supports ?category and ?search filters)",
-            "GET /datasets/{id}/info": "Get dataset information",
-            "POST /datasets/{id}/query": "Query dataset data",
-            "POST /datasets/{id}/spatial": "Spatial query on dataset", 
-            "GET|POST /search": "Search datasets by keyword",
-            "GET /datasets/{id}/stats": "Get dataset statistics",
-            "POST /admin/refresh": "Refresh datasets cache"
-        },
-        "example_usage": {
-            "list_datasets": "GET /datasets?category=transport",
-            "query_data": "POST /datasets/11/query with JSON body: {'where': 'STATUS=1', 'max_records': 20}",
-            "spatial_query": "POST /datasets/11/spatial with JSON body: {'geometry': {...}, 'spatial_rel': 'esriSpatialRelWithin'}"
-        },
-        "timestamp": datetime.utcnow().isoformat()
-    }
-    
-    return create_response(docs)
\ No newline at end of file
+    return func.HttpResponse(_API_DOCS_BYTES, status_code=200, headers=_CORS_HEADERS)
\ No newline at end of file
@@ -4,8 +4,9 @@ Run this to test the deployed function endpoints
 """
 
 import asyncio
+import sys
 import aiohttp
-import json
+import orjson
 from datetime import datetime
 
 class AzureFunctionTester:
@@ -25,42 +26,65 @@ class AzureFunctionTester:
         }
         if function_key:
             self.headers['x-functions-key'] = function_key
+        self._session = None
 
-    async def test_endpoint(self, session: aiohttp.ClientSession, method: str, endpoint: str, data: dict = None):
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared HTTP session (with connection pooling) on first use"""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=30, keepalive_timeout=75)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def test_endpoint(self, method: str, endpoint: str, data: dict = None):
         """Test a single endpoint"""
         url = f"{self.base_url}{endpoint}"
-        
+        session = await self._ensure_session()
+
+        # Buffer this test's output and flush it in one write, so lines from
+        # concurrently running tests don't interleave on stdout
+        lines = [f"\n🧪 Testing {method} {endpoint}"]
+
         try:
-            print(f"\n🧪 Testing {method} {endpoint}")
-            
             if method.upper() == 'GET':
-                async with session.get(url, headers=self.headers) as response:
-                    result = await response.json()
+                async with session.get(url) as response:
+                    result = await response.json(loads=orjson.loads)
                     status = response.status
             else:
-                async with session.post(url, headers=self.headers, json=data) as response:
-                    result = await response.json()
+                async with session.post(url, json=data) as response:
+                    result = await response.json(loads=orjson.loads)
                     status = response.status
-            
+
             if status == 200:
-                print(f"   ✅ Status: {status}")
+                lines.append(f"   ✅ Status: {status}")
                 if 'datasets' in result:
-                    print(f"   📊 Found {len(result['datasets'])} datasets")
+                    lines.append(f"   📊 Found {len(result['datasets'])} datasets")
                 elif 'search_results' in result:
-                    print(f"   🔍 Found {len(result['search_results'])} search results")
+                    lines.append(f"   🔍 Found {len(result['search_results'])} search results")
                 elif 'query_result' in result:
                     features = result['query_result'].get('features', [])
-                    print(f"   📍 Query returned {len(features)} features")
+                    lines.append(f"   📍 Query returned {len(features)} features")
                 else:
-                    print(f"   ℹ️  Response keys: {list(result.keys())}")
+                    lines.append(f"   ℹ️  Response keys: {list(result.keys())}")
             else:
-                print(f"   ❌ Status: {status}")
-                print(f"   🚨 Error: {result}")
-                
+                lines.append(f"   ❌ Status: {status}")
+                lines.append(f"   🚨 Error: {result}")
+
+            sys.stdout.write("\n".join(lines) + "\n")
             return status == 200, result
-            
+
         except Exception as e:
-            print(f"   💥 Exception: {str(e)}")
+            lines.append(f"   💥 Exception: {str(e)}")
+            sys.stdout.write("\n".join(lines) + "\n")
             return False, {"error": str(e)}
 
     async def run_tests(self):
@@ -70,79 +94,70 @@ class AzureFunctionTester:
         print(f"⏰ Started: {datetime.now()}")
         
         results = {}
-        
-        async with aiohttp.ClientSession() as session:
-            
-            # Test 1: Health Check
-            success, result = await self.test_endpoint(session, 'GET', '/health')
-            results['health'] = success
-            
-            # Test 2: API Documentation
-            success, result = await self.test_endpoint(session, 'GET', '/')
-            results['docs'] = success
-            
-            # Test 3: List Datasets
-            success, result = await self.test_endpoint(session, 'GET', '/datasets')
-            results['list_datasets'] = success
-            
-            if success and 'datasets' in result and result['datasets']:
-                # Get first dataset ID for further testing
-                first_dataset = result['datasets'][0]
+
+        try:
+            # Phase A: independent endpoints run concurrently over the shared
+            # connection pool — wall-clock is the max latency, not the sum
+            phase_a = await asyncio.gather(
+                self.test_endpoint('GET', '/health'),
+                self.test_endpoint('GET', '/'),
+                self.test_endpoint('GET', '/datasets'),
+                self.test_endpoint('GET', '/search?q=transport'),
+                self.test_endpoint('POST', '/admin/refresh'),
+            )
+            results['health'] = phase_a[0][0]
+            results['docs'] = phase_a[1][0]
+            list_success, list_result = phase_a[2]
+            results['list_datasets'] = list_success
+            results['search_datasets'] = phase_a[3][0]
+            results['refresh_datasets'] = phase_a[4][0]
+
+            if list_success and 'datasets' in list_result and list_result['datasets']:
+                # Phase B: dataset-specific endpoints depend on the listing
+                first_dataset = list_result['datasets'][0]
                 dataset_id = first_dataset['id']
                 print(f"   🎯 Using dataset '{dataset_id}' for subsequent tests")
-                
-                # Test 4: Dataset Info
-                success, result = await self.test_endpoint(session, 'GET', f'/datasets/{dataset_id}/info')
-                results['dataset_info'] = success
-                
-                # Test 5: Query Dataset
+
                 query_data = {
                     "where": "1=1",
                     "max_records": 5,
                     "fields": "*"
                 }
-                success, result = await self.test_endpoint(session, 'POST', f'/datasets/{dataset_id}/query', query_data)
-                results['query_dataset'] = success
-                
-                # Test 6: Dataset Statistics
-                success, result = await self.test_endpoint(session, 'GET', f'/datasets/{dataset_id}/stats')
-                results['dataset_stats'] = success
-                
+                phase_b = await asyncio.gather(
+                    self.test_endpoint('GET', f'/datasets/{dataset_id}/info'),
+                    self.test_endpoint('POST', f'/datasets/{dataset_id}/query', query_data),
+                    self.test_endpoint('GET', f'/datasets/{dataset_id}/stats'),
+                )
+                results['dataset_info'] = phase_b[0][0]
+                results['query_dataset'] = phase_b[1][0]
+                results['dataset_stats'] = phase_b[2][0]
             else:
                 print("   ⚠️  No datasets available for detailed testing")
                 results['dataset_info'] = False
                 results['query_dataset'] = False
                 results['dataset_stats'] = False
-            
-            # Test 7: Search Datasets
-            success, result = await self.test_endpoint(session, 'GET', '/search?q=transport')
-            results['search_datasets'] = success
-            
-            # Test 8: Refresh Datasets (Admin)
-            success, result = await self.test_endpoint(session, 'POST', '/admin/refresh')
-            results['refresh_datasets'] = success
-        
-        # Summary
-        print("\n" + "="*50)
-        print("📋 TEST RESULTS SUMMARY")
-        print("="*50)
-        
+        finally:
+            await self.close()
+
+        # Summary (batched into a single stdout write)
         total_tests = len(results)
         passed_tests = sum(results.values())
-        
+
+        summary = ["\n" + "="*50, "📋 TEST RESULTS SUMMARY", "="*50]
         for test_name, passed in results.items():
             status = "✅ PASS" if passed else "❌ FAIL"
-            print(f"{test_name:20} {status}")
-        
-        print(f"\nOverall: {passed_tests}/{total_tests} tests passed")
-        
+            summary.append(f"{test_name:20} {status}")
+
+        summary.append(f"\nOverall: {passed_tests}/{total_tests} tests passed")
+
         if passed_tests == total_tests:
-            print("🎉 All tests passed! Your Azure Function is working perfectly.")
+            summary.append("🎉 All tests passed! Your Azure Function is working perfectly.")
         elif passed_tests > total_tests * 0.7:
-            print("⚠️  Most tests passed. Check failed tests above.")
+            summary.append("⚠️  Most tests passed. Check failed tests above.")
         else:
-            print("🚨 Many tests failed. Please check your deployment and configuration.")
-        
+            summary.append("🚨 Many tests failed. Please check your deployment and configuration.")
+
+        sys.stdout.write("\n".join(summary) + "\n")
         return results
 
 async def main():
@@ -37,6 +37,14 @@ pip install --upgrade pip
 echo "📦 Installing dependencies..."
 pip install -r requirements.txt
 
+# Build the package as a wheel and install it from there. The wheel is
+# pure-Python (py3-none-any), so pip's wheel cache hits immediately on
+# repeat deployments instead of re-running the sdist build step.
+echo "📦 Building wheel..."
+pip install --quiet build
+python -m build --wheel
+pip install --force-reinstall dist/*.whl
+
 # Set production environment variables
 echo "🔧 Configuring production settings..."
 export ETHEKWINI_LOG_LEVEL="WARNING"
@@ -0,0 +1,65 @@
+# noqa: D300,D400
+"""
+Monkey patch setuptools to write faster console_scripts with this format:
+
+    import sys
+    from mymodule import entry_function
+    sys.exit(entry_function())
+
+instead of the pkg_resources-based launcher, which scans the whole
+sys.path before the entry point even imports.
+
+Vendored from ninjaaron/fast-entry_points (MIT license).
+
+The patch only matters for legacy easy_install-style script generation;
+setuptools 80 removed easy_install entirely, and pip has long generated
+its own pkg_resources-free scripts from wheel metadata, so on modern
+toolchains this module degrades to a no-op.
+"""
+import re
+
+try:
+    from setuptools.command import easy_install
+except ImportError:  # setuptools >= 80: nothing left to patch
+    easy_install = None
+
+TEMPLATE = r"""
+# -*- coding: utf-8 -*-
+# EASY-INSTALL-ENTRY-SCRIPT: '{3}','{4}','{5}'
+__requires__ = '{3}'
+import re
+import sys
+
+from {0} import {1}
+
+if __name__ == '__main__':
+    sys.argv[0] = re.sub(r'(-script\.pyw?|\.exe)?$', '', sys.argv[0])
+    sys.exit({2}())
+""".lstrip()
+
+
+@classmethod
+def get_args(cls, dist, header=None):
+    """
+    Yield write_script() argument tuples for a distribution's
+    console_scripts and gui_scripts entry points.
+    """
+    if header is None:
+        header = cls.get_header()
+    spec = str(dist.as_requirement())
+    for type_ in 'console', 'gui':
+        group = type_ + '_scripts'
+        for name, ep in dist.get_entry_map(group).items():
+            # ensure the script name is a valid filename
+            if re.search(r'[\\/]', name):
+                raise ValueError("Path separators not allowed in script names")
+            script_text = TEMPLATE.format(
+                ep.module_name, ep.attrs[0], '.'.join(ep.attrs),
+                spec, group, name)
+            args = cls._get_script_args(type_, name, header, script_text)
+            for res in args:
+                yield res
+
+
+if easy_install is not None:
+    easy_install.ScriptWriter.get_args = get_args
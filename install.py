@@ -4,20 +4,67 @@ Installation script for eThekwini ESRI GIS MCP Server
 Use this to quickly set up the development environment
 """
 
+import hashlib
 import os
+import shutil
 import subprocess
 import sys
+from collections import deque
 
-def run_command(command, description):
-    """Run a shell command and handle errors"""
+# Marker directory for the requirements-hash install gate
+CACHE_DIR = os.path.expanduser("~/.cache/ethekwini-gis-mcp")
+
+def run_command(argv, description, echo=True):
+    """Run a command (argv list, no shell) and handle errors.
+
+    Output streams through a bounded tail buffer rather than being captured
+    wholesale, so a multi-megabyte pip log never sits in memory. With
+    echo=False only the buffered tail is shown, and only on failure.
+    """
     print(f"🔄 {description}...")
-    try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+    tail = deque(maxlen=200)
+    proc = subprocess.Popen(argv, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in proc.stdout:
+        tail.append(line)
+        if echo:
+            sys.stdout.write(line)
+    returncode = proc.wait()
+    if returncode == 0:
         print(f"✅ {description} completed successfully")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed: {e.stderr}")
+    if not echo:
+        sys.stdout.writelines(tail)
+    print(f"❌ {description} failed with exit code {returncode}")
+    return False
+
+def requirements_file():
+    """Prefer the pinned lockfile (see 'make lock') over the loose ranges"""
+    return "requirements.lock" if os.path.exists("requirements.lock") else "requirements.txt"
+
+def requirements_digest(req_file):
+    """Hash of the requirements file, used to gate re-installs"""
+    with open(req_file, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def deps_cache_hit(digest):
+    """True if the cached hash matches and the packages still import"""
+    marker = os.path.join(CACHE_DIR, "req.sha256")
+    try:
+        with open(marker) as f:
+            if f.read().strip() != digest:
+                return False
+    except OSError:
         return False
+    probe = subprocess.run([sys.executable, "-c", "import mcp, httpx"],
+                           capture_output=True)
+    return probe.returncode == 0
+
+def write_deps_marker(digest):
+    """Record the installed requirements hash for the next run"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(os.path.join(CACHE_DIR, "req.sha256"), "w") as f:
+        f.write(digest)
 
 def main():
     print("🚀 eThekwini GIS MCP Server Setup")
@@ -30,27 +77,72 @@ def main():
     
     print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor} detected")
     
-    # Install requirements
-    if not run_command("pip install -r requirements.txt", "Installing Python dependencies"):
-        print("\n💡 If pip install fails, try:")
-        print("   pip install --user -r requirements.txt")
-        print("   or")
-        print("   python -m pip install -r requirements.txt")
-        return False
+    # Skip the install entirely when the requirements haven't changed since
+    # the last successful run and the packages still import
+    req_file = requirements_file()
+    locked = req_file.endswith(".lock")
+    digest = requirements_digest(req_file)
+    if deps_cache_hit(digest):
+        print("✅ Dependencies up-to-date (cache hit)")
+    else:
+        # Prefer uv when it's on PATH: it resolves and downloads in parallel and
+        # shares pip's wheel cache, which is dramatically faster on cold installs
+        uv = shutil.which("uv")
+        if uv:
+            install_cmd = [uv, "pip", "install", "--system", "-r", req_file]
+        else:
+            # Bootstrap pip and wheel first so the requirements install can hit
+            # pip's built-wheel cache instead of rebuilding sdists on every run
+            run_command([sys.executable, "-m", "pip", "install", "--upgrade", "pip", "wheel"],
+                        "Bootstrapping pip and wheel", echo=False)
+            # Install requirements, preferring pre-built wheels and an explicit
+            # cache dir that survives across virtualenvs
+            install_cmd = [sys.executable, "-m", "pip", "install", "--prefer-binary",
+                           "--cache-dir", os.path.expanduser("~/.cache/pip"),
+                           "-r", req_file]
+            if locked:
+                # The lockfile already pins the full transitive closure, so
+                # pip can skip dependency resolution entirely
+                install_cmd.insert(-2, "--no-deps")
+
+        if not run_command(install_cmd, "Installing Python dependencies"):
+            print("\n💡 If pip install fails, try:")
+            print("   pip install --user -r requirements.txt")
+            print("   or")
+            print("   python -m pip install -r requirements.txt")
+            return False
+        write_deps_marker(digest)
     
-    # Test imports
+    # Pre-compile bytecode now, while the user is already waiting, so the
+    # first server start and test run skip the compile step
+    run_command([sys.executable, "-m", "compileall", "-q", "-j", "0", "src", "tests"],
+                "Pre-compiling bytecode", echo=False)
+
+    # Test imports in a throwaway subprocess so the installer process never
+    # loads the full httpx/mcp module tree just to check availability
     print("\n🔍 Testing imports...")
     try:
-        import mcp
-        import httpx
+        subprocess.run([sys.executable, "-c", "import mcp, httpx"], check=True)
         print("✅ All required packages imported successfully")
-    except ImportError as e:
-        print(f"❌ Import failed: {e}")
+    except subprocess.CalledProcessError:
+        print("❌ Import check failed: mcp and/or httpx are not importable")
         return False
     
-    # Run tests
+    # Run tests; the suite needs the optional test extra (pytest +
+    # pytest-asyncio), which requirements.txt deliberately leaves out of the
+    # runtime install, so skip cleanly rather than fail the setup without it
     print("\n🧪 Running tests...")
-    if run_command("python tests/test_mcp_server.py", "Running MCP server tests"):
+    probe = subprocess.run([sys.executable, "-c", "import pytest, pytest_asyncio"],
+                           capture_output=True)
+    if probe.returncode != 0:
+        print("⚠️  pytest/pytest-asyncio not installed; skipping the test run")
+        print("   Install them with: pip install .[test]")
+        tests_passed = True
+    else:
+        tests_passed = run_command([sys.executable, "-m", "pytest", "tests", "-q"],
+                                   "Running MCP server tests")
+
+    if tests_passed:
         print("\n🎉 Setup completed successfully!")
         print("\nNext steps:")
         print("1. Configure your MCP client with the settings in mcp-config.json")
@@ -4,13 +4,26 @@ Provides access to eThekwini municipality's open GIS data portal
 """
 
 import asyncio
-import json
 import logging
 import os
+import sys
+import tempfile
+import time
+from itertools import islice
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Sequence
 from urllib.parse import urljoin, urlparse, parse_qs
 import httpx
+import jsonschema
+import orjson
+try:
+    # Optional: GEOS-backed WKT parsing. Without it, WKT geometry arguments
+    # are passed through to the server untouched, as before.
+    from shapely import wkt as _shapely_wkt
+except ImportError:
+    _shapely_wkt = None
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.types import (
@@ -38,25 +51,469 @@ logging.basicConfig(
 logger = logging.getLogger("ethekwini-gis-mcp")
 
 # Log startup information
-logger.info(f"eThekwini GIS MCP Server v{__version__} starting up...")
+logger.info("eThekwini GIS MCP Server v%s starting up...", __version__)
+
+# Resource URI shape, compiled once: extracts (type, id) and rejects
+# malformed URIs in a single pass
+_URI_RE = re.compile(r"^ethekwini-gis://(dataset|service)/(.+)$")
+
+# Word tokens for the search index
+_TOKEN_RE = re.compile(r"\w+")
+
+# Leading keyword of a WKT geometry literal
+_WKT_RE = re.compile(
+    r"^\s*(POINT|LINESTRING|POLYGON|MULTIPOINT|MULTILINESTRING|MULTIPOLYGON)\b",
+    re.IGNORECASE)
+
+def _wkt_to_esri(geometry: str):
+    """Convert a WKT string to an (esri_json, esriGeometryType) pair using
+    Shapely's GEOS parser. Returns None when shapely is unavailable or the
+    string does not parse, in which case the caller falls back to passing
+    the raw value through to the server."""
+    if _shapely_wkt is None:
+        return None
+    try:
+        geom = _shapely_wkt.loads(geometry)
+    except Exception:
+        return None
+    gtype = geom.geom_type
+    if gtype == "Point":
+        return {"x": geom.x, "y": geom.y}, "esriGeometryPoint"
+    if gtype in ("LineString", "MultiLineString"):
+        lines = [geom] if gtype == "LineString" else list(geom.geoms)
+        return ({"paths": [[list(pt) for pt in line.coords] for line in lines]},
+                "esriGeometryPolyline")
+    if gtype in ("Polygon", "MultiPolygon"):
+        polys = [geom] if gtype == "Polygon" else list(geom.geoms)
+        rings = []
+        for poly in polys:
+            rings.append([list(pt) for pt in poly.exterior.coords])
+            for ring in poly.interiors:
+                rings.append([list(pt) for pt in ring.coords])
+        return {"rings": rings}, "esriGeometryPolygon"
+    return None
+
+# Invariant tag/category prefixes and owner shared by every dataset record;
+# tuples of interned strings, so hundreds of cached records all reference
+# the same handful of string objects instead of fresh copies per refresh
+_BASE_TAGS = (sys.intern("eThekwini"), sys.intern("municipality"), sys.intern("GIS"))
+_BASE_CATEGORIES = (sys.intern("Municipal Services"),)
+_TYPE_FEATURE_SERVICE = sys.intern("Feature Service")
+_OWNER = {"name": "eThekwini Municipality"}
+
+@dataclass(slots=True)
+class DatasetInfo:
+    """One discovered dataset. Slotted: hundreds of these records live in
+    the cache for the server's lifetime, and slots cut the per-record
+    footprint roughly in half versus a dict of string keys."""
+    id: str
+    name: str
+    title: str
+    description: str
+    type: str
+    url: str
+    created: str = ""
+    updated: str = ""
+    tags: tuple = _BASE_TAGS
+    categories: tuple = _BASE_CATEGORIES
+    owner: Dict[str, str] = field(default_factory=lambda: _OWNER)
+    service_info: Dict[str, Any] = field(default_factory=dict)
+    layers: List[Any] = field(default_factory=list)
+    # Lowercase name, computed once at creation so search never re-lowercases
+    name_lower: str = ""
+
+    def __post_init__(self):
+        if not self.name_lower:
+            self.name_lower = self.name.lower()
+
+@dataclass(slots=True)
+class ServiceInfo:
+    """One discovered ArcGIS service endpoint"""
+    name: str
+    url: str
+    type: str
+    dataset_id: str
+    info: Dict[str, Any]
+
+# The tool catalog is static: build it once at import instead of
+# reconstructing ten Tool objects and their JSON Schemas per listing call
+_STATIC_TOOLS = (
+    Tool(
+        name="refresh_datasets",
+        description="Refresh and discover eThekwini GIS datasets and services",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="search_datasets",
+        description="Search eThekwini datasets by keyword, category, or tag",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (keywords, tags, or categories)"
+                },
+                "category": {
+                    "type": "string",
+                    "description": "Filter by category (e.g., 'Transportation', 'Environment')"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results",
+                    "default": 20
+                }
+            }
+        }
+    ),
+    Tool(
+        name="get_dataset_info",
+        description="Get detailed information about a specific dataset",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dataset_id": {
+                    "type": "string",
+                    "description": "Dataset ID or name"
+                }
+            },
+            "required": ["dataset_id"]
+        }
+    ),
+    Tool(
+        name="query_feature_layer",
+        description="Query features from a dataset's feature layer",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "service_url": {
+                    "type": "string",
+                    "description": "Feature service URL"
+                },
+                "layer_id": {
+                    "type": "integer", 
+                    "description": "Layer ID (default: 0)",
+                    "default": 0
+                },
+                "where": {
+                    "type": "string",
+                    "description": "SQL WHERE clause for filtering",
+                    "default": "1=1"
+                },
+                "geometry": {
+                    "type": "string",
+                    "description": "Geometry for spatial filtering (WKT or JSON)"
+                },
+                "spatial_rel": {
+                    "type": "string",
+                    "description": "Spatial relationship (intersects, contains, within, etc.)",
+                    "default": "esriSpatialRelIntersects"
+                },
+                "return_geometry": {
+                    "type": "boolean",
+                    "description": "Include geometry in results",
+                    "default": True
+                },
+                "max_records": {
+                    "type": "integer",
+                    "description": "Maximum records to return",
+                    "default": 100
+                },
+                "out_fields": {
+                    "type": "string",
+                    "description": "Comma-separated list of fields to return (* for all)",
+                    "default": "*"
+                },
+                "fetch_all": {
+                    "type": "boolean",
+                    "description": "Fetch every matching feature with parallel pagination; max_records is ignored but the other filters and projections still apply",
+                    "default": False
+                }
+            },
+            "required": ["service_url"]
+        }
+    ),
+    Tool(
+        name="get_layer_statistics",
+        description="Get statistics for numeric fields in a layer",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "service_url": {
+                    "type": "string",
+                    "description": "Feature service URL"
+                },
+                "layer_id": {
+                    "type": "integer",
+                    "description": "Layer ID",
+                    "default": 0
+                },
+                "field_name": {
+                    "type": "string",
+                    "description": "Field name for statistics"
+                },
+                "statistic_type": {
+                    "type": "string",
+                    "description": "Type of statistic (count, sum, min, max, avg, stddev)",
+                    "default": "count"
+                },
+                "where": {
+                    "type": "string", 
+                    "description": "WHERE clause for filtering",
+                    "default": "1=1"
+                }
+            },
+            "required": ["service_url", "field_name"]
+        }
+    ),
+    Tool(
+        name="list_municipal_services",
+        description="List available municipal service categories",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_layer_fields",
+        description="Get field information for a feature layer",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "service_url": {
+                    "type": "string",
+                    "description": "Feature service URL"
+                },
+                "layer_id": {
+                    "type": "integer",
+                    "description": "Layer ID",
+                    "default": 0
+                }
+            },
+            "required": ["service_url"]
+        }
+    ),
+    Tool(
+        name="spatial_query_by_coordinates",
+        description="Query features within a bounding box or near coordinates",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "service_url": {
+                    "type": "string",
+                    "description": "Feature service URL"
+                },
+                "layer_id": {
+                    "type": "integer",
+                    "description": "Layer ID",
+                    "default": 0
+                },
+                "xmin": {
+                    "type": "number",
+                    "description": "Minimum X coordinate (longitude)"
+                },
+                "ymin": {
+                    "type": "number",
+                    "description": "Minimum Y coordinate (latitude)"
+                },
+                "xmax": {
+                    "type": "number",
+                    "description": "Maximum X coordinate (longitude)"
+                },
+                "ymax": {
+                    "type": "number",
+                    "description": "Maximum Y coordinate (latitude)"
+                },
+                "buffer_distance": {
+                    "type": "number",
+                    "description": "Buffer distance in meters for point queries"
+                },
+                "max_records": {
+                    "type": "integer",
+                    "description": "Maximum records to return",
+                    "default": 100
+                },
+                "out_fields": {
+                    "type": "string",
+                    "description": "Comma-separated list of fields to return (* for all); narrowing this is the fastest way to shrink large responses",
+                    "default": "*"
+                },
+                "return_geometry": {
+                    "type": "boolean",
+                    "description": "Include geometry in results; disable for attribute-only queries to cut payload size",
+                    "default": True
+                }
+            },
+            "required": ["service_url", "xmin", "ymin", "xmax", "ymax"]
+        }
+    ),
+    Tool(
+        name="add_known_service",
+        description="Add a known eThekwini service URL to the server",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "service_name": {
+                    "type": "string",
+                    "description": "Name for the service"
+                },
+                "service_url": {
+                    "type": "string",
+                    "description": "Full URL to the ArcGIS service"
+                }
+            },
+            "required": ["service_name", "service_url"]
+        }
+    ),
+    Tool(
+        name="query_leases_dataset",
+        description="Query the eThekwini Leases dataset with specific filters",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "where": {
+                    "type": "string",
+                    "description": "SQL WHERE clause for filtering leases",
+                    "default": "1=1"
+                },
+                "layer_id": {
+                    "type": "integer",
+                    "description": "Layer ID in the Leases service",
+                    "default": 11
+                },
+                "format": {
+                    "type": "string",
+                    "description": "Output format (json, geojson)",
+                    "default": "geojson"
+                },
+                "max_records": {
+                    "type": "integer",
+                    "description": "Maximum records to return",
+                    "default": 100
+                },
+                "out_fields": {
+                    "type": "string",
+                    "description": "Comma-separated list of fields to return (* for all); narrowing this is the fastest way to shrink large responses",
+                    "default": "*"
+                },
+                "return_geometry": {
+                    "type": "boolean",
+                    "description": "Include lease geometry in results; disable for attribute-only queries to cut payload size",
+                    "default": True
+                }
+            }
+        }
+    )
+)
+
+# Argument validators compiled once per process from the tool schemas;
+# Draft202012Validator pre-resolves the schema so per-call validation is
+# cheap and produces uniform error messages
+_TOOL_VALIDATORS = {
+    tool.name: jsonschema.Draft202012Validator(tool.inputSchema)
+    for tool in _STATIC_TOOLS
+}
 
 class EThekwiniGISServer:
     def __init__(self):
         self.base_url = "https://gis-ethekwini.opendata.arcgis.com"
         self.api_base = "https://services3.arcgis.com/HO0zfySJshlD6Twu/arcgis/rest/services"
         self.server = Server("ethekwini-gis-mcp")
-        self.client = httpx.AsyncClient(timeout=60.0, follow_redirects=True)
+        # One pooled client shared by every ArcGIS call: HTTP/2 multiplexing
+        # plus a generous keepalive pool keeps TLS handshakes off the hot path
+        # during concurrent discovery and queries
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=50,
+                keepalive_expiry=60.0,
+            ),
+            # Offer brotli ahead of gzip: ArcGIS JSON compresses well and
+            # httpx decodes br transparently via the brotli extra
+            headers={"Accept-Encoding": "br, gzip, deflate"},
+        )
+        # Cap concurrent discovery fetches so the fan-out doesn't overwhelm
+        # the ArcGIS REST endpoint
+        self._discovery_semaphore = asyncio.Semaphore(10)
+        # Per-URL TTL cache for service metadata, so individual entries age
+        # out on their own schedule instead of re-fetching everything on each
+        # blanket refresh; url -> (monotonic timestamp, data)
+        self._svc_cache: Dict[str, Any] = {}
+        self._svc_cache_ttl = 900.0
+        # TTL cache for layer field listings, which change about as rarely
+        # as the schemas they describe; (service_url, layer_id) -> (ts, info)
+        self._layer_fields_cache: Dict[tuple, Any] = {}
+        self._layer_fields_ttl = 1800.0
+        # Both metadata caches are LRU-bounded: hits reinsert the entry at
+        # the end of the dict and inserts evict from the front, so a long
+        # catalog crawl can't grow them without limit
+        self._metadata_cache_max = 256
+        # In-flight service-info fetches keyed by URL; lets concurrent
+        # callers await one shared request instead of duplicating the GET
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Single-flight guard for the full refresh itself
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
         self.cached_datasets = {}
         self.cached_services = {}
-        self.last_refresh = None
+        # Serialized resource bodies, keyed by (type, id); filled lazily on
+        # first read and dropped wholesale whenever a refresh swaps the
+        # caches, so repeat reads of a 50-200 KB service_info cost nothing
+        self._resource_json_cache: Dict[Any, str] = {}
+        # Monotonic timestamp of the last successful refresh; never compared
+        # against wall-clock time
+        self.last_refresh: Optional[float] = None
+        # On-disk snapshot of the discovery results, so a cold start can
+        # skip the catalog fan-out when a recent refresh is already on disk
+        self._cache_path = Path(os.getenv("ETHEKWINI_CACHE_FILE")
+                                or os.path.join(tempfile.gettempdir(), "ethekwini_gis_cache.json"))
+        self._cache_ttl = 3600
+        # Search structures rebuilt once per refresh: token and category
+        # posting sets plus the per-dataset lowercase text blob used for
+        # substring verification
+        self._index: Dict[str, set] = {}
+        self._category_index: Dict[str, set] = {}
+        self._search_blobs: Dict[str, str] = {}
+        # Lowercased name/title -> dataset id, for O(1) lookups by
+        # human-readable name in _get_dataset_info
+        self._name_to_id: Dict[str, str] = {}
+        # Aggregates served verbatim by _list_municipal_services, rebuilt
+        # alongside the search index instead of rescanned per call
+        self._categories: Dict[str, List[str]] = {}
+        self._service_types: Dict[str, int] = {}
         self.group_id = "bc9877523e074449bae4dcdb6a118e12"
         
         # Known service endpoints from eThekwini
+        # The hot leases endpoint, prebuilt once so _query_leases_dataset
+        # only formats the layer suffix per call
+        self._leases_base = "https://services3.arcgis.com/HO0zfySJshlD6Twu/arcgis/rest/services/Leases/FeatureServer"
         self.known_services = {
-            "Leases": "https://services3.arcgis.com/HO0zfySJshlD6Twu/arcgis/rest/services/Leases/FeatureServer",
+            "Leases": self._leases_base,
             # Add more as discovered
         }
         
+        # Tool-name -> handler dispatch table; a single dict lookup replaces
+        # the string-comparison ladder in handle_call_tool
+        self._tool_dispatch = {
+            "refresh_datasets": self._tool_refresh_datasets,
+            "search_datasets": self._tool_search_datasets,
+            "get_dataset_info": self._tool_get_dataset_info,
+            "query_feature_layer": self._tool_query_feature_layer,
+            "get_layer_statistics": self._tool_get_layer_statistics,
+            "list_municipal_services": self._tool_list_municipal_services,
+            "get_layer_fields": self._tool_get_layer_fields,
+            "spatial_query_by_coordinates": self._tool_spatial_query_by_coordinates,
+            "add_known_service": self._tool_add_known_service,
+            "query_leases_dataset": self._tool_query_leases_dataset,
+        }
+
         # Register handlers
         self._register_handlers()
     
@@ -74,17 +531,17 @@ class EThekwiniGISServer:
             for dataset_id, dataset_info in self.cached_datasets.items():
                 resources.append(Resource(
                     uri=f"ethekwini-gis://dataset/{dataset_id}",
-                    name=f"Dataset: {dataset_info.get('name', dataset_id)}",
-                    description=dataset_info.get('description', 'eThekwini GIS Dataset'),
+                    name=f"Dataset: {dataset_info.name}",
+                    description=dataset_info.description,
                     mimeType="application/json"
                 ))
-            
+
             # Add service resources
             for service_name, service_info in self.cached_services.items():
                 resources.append(Resource(
                     uri=f"ethekwini-gis://service/{service_name}",
                     name=f"Service: {service_name}",
-                    description=service_info.get('description', 'eThekwini GIS Service'),
+                    description='eThekwini GIS Service',
                     mimeType="application/json"
                 ))
             
@@ -93,622 +550,495 @@ class EThekwiniGISServer:
         @self.server.read_resource()
         async def handle_read_resource(uri: str) -> str:
             """Read eThekwini GIS resource details"""
-            if not uri.startswith("ethekwini-gis://"):
-                raise ValueError(f"Unsupported URI scheme: {uri}")
-            
-            parts = uri.replace("ethekwini-gis://", "").split("/")
-            resource_type = parts[0]
-            resource_id = parts[1] if len(parts) > 1 else ""
-            
+            m = _URI_RE.match(uri)
+            if not m:
+                raise ValueError(f"Unsupported URI: {uri}")
+            resource_type, resource_id = m.group(1), m.group(2)
+
             await self._refresh_datasets()
             
             if resource_type == "dataset" and resource_id in self.cached_datasets:
-                return json.dumps(self.cached_datasets[resource_id], indent=2)
+                record = await self._hydrate_dataset(self.cached_datasets[resource_id])
             elif resource_type == "service" and resource_id in self.cached_services:
-                return json.dumps(self.cached_services[resource_id], indent=2)
+                record = self.cached_services[resource_id]
             else:
                 raise ValueError(f"Resource not found: {uri}")
+
+            key = (resource_type, resource_id)
+            cached = self._resource_json_cache.get(key)
+            if cached is None:
+                cached = orjson.dumps(asdict(record), option=orjson.OPT_INDENT_2).decode()
+                self._resource_json_cache[key] = cached
+            return cached
         
         @self.server.list_tools()
         async def handle_list_tools() -> list[Tool]:
             """List available eThekwini GIS tools"""
-            await self._refresh_datasets()
-            
-            tools = [
-                Tool(
-                    name="refresh_datasets",
-                    description="Refresh and discover eThekwini GIS datasets and services",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="search_datasets",
-                    description="Search eThekwini datasets by keyword, category, or tag",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search query (keywords, tags, or categories)"
-                            },
-                            "category": {
-                                "type": "string",
-                                "description": "Filter by category (e.g., 'Transportation', 'Environment')"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of results",
-                                "default": 20
-                            }
-                        }
-                    }
-                ),
-                Tool(
-                    name="get_dataset_info",
-                    description="Get detailed information about a specific dataset",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "dataset_id": {
-                                "type": "string",
-                                "description": "Dataset ID or name"
-                            }
-                        },
-                        "required": ["dataset_id"]
-                    }
-                ),
-                Tool(
-                    name="query_feature_layer",
-                    description="Query features from a dataset's feature layer",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "service_url": {
-                                "type": "string",
-                                "description": "Feature service URL"
-                            },
-                            "layer_id": {
-                                "type": "integer", 
-                                "description": "Layer ID (default: 0)",
-                                "default": 0
-                            },
-                            "where": {
-                                "type": "string",
-                                "description": "SQL WHERE clause for filtering",
-                                "default": "1=1"
-                            },
-                            "geometry": {
-                                "type": "string",
-                                "description": "Geometry for spatial filtering (WKT or JSON)"
-                            },
-                            "spatial_rel": {
-                                "type": "string",
-                                "description": "Spatial relationship (intersects, contains, within, etc.)",
-                                "default": "esriSpatialRelIntersects"
-                            },
-                            "return_geometry": {
-                                "type": "boolean",
-                                "description": "Include geometry in results",
-                                "default": True
-                            },
-                            "max_records": {
-                                "type": "integer",
-                                "description": "Maximum records to return",
-                                "default": 100
-                            },
-                            "out_fields": {
-                                "type": "string",
-                                "description": "Comma-separated list of fields to return (* for all)",
-                                "default": "*"
-                            }
-                        },
-                        "required": ["service_url"]
-                    }
-                ),
-                Tool(
-                    name="get_layer_statistics",
-                    description="Get statistics for numeric fields in a layer",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "service_url": {
-                                "type": "string",
-                                "description": "Feature service URL"
-                            },
-                            "layer_id": {
-                                "type": "integer",
-                                "description": "Layer ID",
-                                "default": 0
-                            },
-                            "field_name": {
-                                "type": "string",
-                                "description": "Field name for statistics"
-                            },
-                            "statistic_type": {
-                                "type": "string",
-                                "description": "Type of statistic (count, sum, min, max, avg, stddev)",
-                                "default": "count"
-                            },
-                            "where": {
-                                "type": "string", 
-                                "description": "WHERE clause for filtering",
-                                "default": "1=1"
-                            }
-                        },
-                        "required": ["service_url", "field_name"]
-                    }
-                ),
-                Tool(
-                    name="list_municipal_services",
-                    description="List available municipal service categories",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="get_layer_fields",
-                    description="Get field information for a feature layer",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "service_url": {
-                                "type": "string",
-                                "description": "Feature service URL"
-                            },
-                            "layer_id": {
-                                "type": "integer",
-                                "description": "Layer ID",
-                                "default": 0
-                            }
-                        },
-                        "required": ["service_url"]
-                    }
-                ),
-                Tool(
-                    name="spatial_query_by_coordinates",
-                    description="Query features within a bounding box or near coordinates",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "service_url": {
-                                "type": "string",
-                                "description": "Feature service URL"
-                            },
-                            "layer_id": {
-                                "type": "integer",
-                                "description": "Layer ID",
-                                "default": 0
-                            },
-                            "xmin": {
-                                "type": "number",
-                                "description": "Minimum X coordinate (longitude)"
-                            },
-                            "ymin": {
-                                "type": "number",
-                                "description": "Minimum Y coordinate (latitude)"
-                            },
-                            "xmax": {
-                                "type": "number",
-                                "description": "Maximum X coordinate (longitude)"
-                            },
-                            "ymax": {
-                                "type": "number",
-                                "description": "Maximum Y coordinate (latitude)"
-                            },
-                            "buffer_distance": {
-                                "type": "number",
-                                "description": "Buffer distance in meters for point queries"
-                            },
-                            "max_records": {
-                                "type": "integer",
-                                "description": "Maximum records to return",
-                                "default": 100
-                            }
-                        },
-                        "required": ["service_url", "xmin", "ymin", "xmax", "ymax"]
-                    }
-                ),
-                Tool(
-                    name="add_known_service",
-                    description="Add a known eThekwini service URL to the server",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "service_name": {
-                                "type": "string",
-                                "description": "Name for the service"
-                            },
-                            "service_url": {
-                                "type": "string",
-                                "description": "Full URL to the ArcGIS service"
-                            }
-                        },
-                        "required": ["service_name", "service_url"]
-                    }
-                ),
-                Tool(
-                    name="query_leases_dataset",
-                    description="Query the eThekwini Leases dataset with specific filters",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "where": {
-                                "type": "string",
-                                "description": "SQL WHERE clause for filtering leases",
-                                "default": "1=1"
-                            },
-                            "layer_id": {
-                                "type": "integer",
-                                "description": "Layer ID in the Leases service",
-                                "default": 11
-                            },
-                            "format": {
-                                "type": "string",
-                                "description": "Output format (json, geojson)",
-                                "default": "geojson"
-                            },
-                            "max_records": {
-                                "type": "integer",
-                                "description": "Maximum records to return",
-                                "default": 100
-                            }
-                        }
-                    }
-                )
-            ]
-            
-            return tools
+            return list(_STATIC_TOOLS)
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
             """Handle tool calls"""
-            
+
             try:
-                if name == "refresh_datasets":
-                    await self._refresh_datasets(force=True)
-                    return [types.TextContent(
-                        type="text",
-                        text=f"Refreshed datasets. Found {len(self.cached_datasets)} datasets and {len(self.cached_services)} services."
-                    )]
-                
-                elif name == "search_datasets":
-                    results = await self._search_datasets(
-                        query=arguments.get("query", ""),
-                        category=arguments.get("category"),
-                        limit=arguments.get("limit", 20)
-                    )
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(results, indent=2)
-                    )]
-                
-                elif name == "get_dataset_info":
-                    result = await self._get_dataset_info(arguments["dataset_id"])
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "query_feature_layer":
-                    result = await self._query_feature_layer(
-                        service_url=arguments["service_url"],
-                        layer_id=arguments.get("layer_id", 0),
-                        where=arguments.get("where", "1=1"),
-                        geometry=arguments.get("geometry"),
-                        spatial_rel=arguments.get("spatial_rel", "esriSpatialRelIntersects"),
-                        return_geometry=arguments.get("return_geometry", True),
-                        max_records=arguments.get("max_records", 100),
-                        out_fields=arguments.get("out_fields", "*")
-                    )
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "get_layer_statistics":
-                    result = await self._get_layer_statistics(
-                        service_url=arguments["service_url"],
-                        layer_id=arguments.get("layer_id", 0),
-                        field_name=arguments["field_name"],
-                        statistic_type=arguments.get("statistic_type", "count"),
-                        where=arguments.get("where", "1=1")
-                    )
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "list_municipal_services":
-                    result = await self._list_municipal_services()
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "get_layer_fields":
-                    result = await self._get_layer_fields(
-                        service_url=arguments["service_url"],
-                        layer_id=arguments.get("layer_id", 0)
-                    )
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "spatial_query_by_coordinates":
-                    result = await self._spatial_query_by_coordinates(
-                        service_url=arguments["service_url"],
-                        layer_id=arguments.get("layer_id", 0),
-                        xmin=arguments["xmin"],
-                        ymin=arguments["ymin"],
-                        xmax=arguments["xmax"],
-                        ymax=arguments["ymax"],
-                        buffer_distance=arguments.get("buffer_distance"),
-                        max_records=arguments.get("max_records", 100)
-                    )
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "add_known_service":
-                    result = await self._add_known_service(
-                        service_name=arguments["service_name"],
-                        service_url=arguments["service_url"]
-                    )
-                    return [types.TextContent(
-                        type="text",
-                        text=result
-                    )]
-                
-                elif name == "query_leases_dataset":
-                    result = await self._query_leases_dataset(
-                        where=arguments.get("where", "1=1"),
-                        layer_id=arguments.get("layer_id", 11),
-                        format=arguments.get("format", "geojson"),
-                        max_records=arguments.get("max_records", 100)
-                    )
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                else:
+                handler = self._tool_dispatch.get(name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {name}")
-                    
+                _TOOL_VALIDATORS[name].validate(arguments or {})
+                text = await handler(arguments)
+                return [types.TextContent(
+                    type="text",
+                    text=text
+                )]
+
             except Exception as e:
-                logger.error(f"Error in tool {name}: {e}")
+                logger.error("Error in tool %s: %s", name, e)
                 return [types.TextContent(
                     type="text",
                     text=f"Error executing {name}: {str(e)}"
                 )]
-    
+
+    # --- Tool implementations ------------------------------------------------
+    # Each takes the raw MCP arguments dict and returns the response text;
+    # handle_call_tool resolves them through _tool_dispatch in O(1)
+
+    async def _tool_refresh_datasets(self, arguments: dict) -> str:
+        await self._refresh_datasets(force=True)
+        return f"Refreshed datasets. Found {len(self.cached_datasets)} datasets and {len(self.cached_services)} services."
+
+    async def _tool_search_datasets(self, arguments: dict) -> str:
+        results = await self._search_datasets(
+            query=arguments.get("query", ""),
+            category=arguments.get("category"),
+            limit=arguments.get("limit", 20)
+        )
+        return orjson.dumps([asdict(r) for r in results], option=orjson.OPT_INDENT_2).decode()
+
+    async def _tool_get_dataset_info(self, arguments: dict) -> str:
+        result = await self._get_dataset_info(arguments["dataset_id"])
+        return orjson.dumps(asdict(result), option=orjson.OPT_INDENT_2).decode()
+
+    async def _tool_query_feature_layer(self, arguments: dict) -> str:
+        if arguments.get("fetch_all"):
+            result = await self._query_all(
+                service_url=arguments["service_url"],
+                layer_id=arguments.get("layer_id", 0),
+                where=arguments.get("where", "1=1"),
+                geometry=arguments.get("geometry"),
+                spatial_rel=arguments.get("spatial_rel", "esriSpatialRelIntersects"),
+                return_geometry=arguments.get("return_geometry", True),
+                out_fields=arguments.get("out_fields", "*")
+            )
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+        result = await self._query_feature_layer(
+            service_url=arguments["service_url"],
+            layer_id=arguments.get("layer_id", 0),
+            where=arguments.get("where", "1=1"),
+            geometry=arguments.get("geometry"),
+            spatial_rel=arguments.get("spatial_rel", "esriSpatialRelIntersects"),
+            return_geometry=arguments.get("return_geometry", True),
+            max_records=arguments.get("max_records", 100),
+            out_fields=arguments.get("out_fields", "*")
+        )
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+    async def _tool_get_layer_statistics(self, arguments: dict) -> str:
+        result = await self._get_layer_statistics(
+            service_url=arguments["service_url"],
+            layer_id=arguments.get("layer_id", 0),
+            field_name=arguments["field_name"],
+            statistic_type=arguments.get("statistic_type", "count"),
+            where=arguments.get("where", "1=1")
+        )
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+    async def _tool_list_municipal_services(self, arguments: dict) -> str:
+        result = await self._list_municipal_services()
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+    async def _tool_get_layer_fields(self, arguments: dict) -> str:
+        result = await self._get_layer_fields(
+            service_url=arguments["service_url"],
+            layer_id=arguments.get("layer_id", 0)
+        )
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+    async def _tool_spatial_query_by_coordinates(self, arguments: dict) -> str:
+        result = await self._spatial_query_by_coordinates(
+            service_url=arguments["service_url"],
+            layer_id=arguments.get("layer_id", 0),
+            xmin=arguments["xmin"],
+            ymin=arguments["ymin"],
+            xmax=arguments["xmax"],
+            ymax=arguments["ymax"],
+            buffer_distance=arguments.get("buffer_distance"),
+            max_records=arguments.get("max_records", 100),
+            out_fields=arguments.get("out_fields", "*"),
+            return_geometry=arguments.get("return_geometry", True)
+        )
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+    async def _tool_add_known_service(self, arguments: dict) -> str:
+        return await self._add_known_service(
+            service_name=arguments["service_name"],
+            service_url=arguments["service_url"]
+        )
+
+    async def _tool_query_leases_dataset(self, arguments: dict) -> str:
+        result = await self._query_leases_dataset(
+            where=arguments.get("where", "1=1"),
+            layer_id=arguments.get("layer_id", 11),
+            format=arguments.get("format", "geojson"),
+            max_records=arguments.get("max_records", 100),
+            out_fields=arguments.get("out_fields", "*"),
+            return_geometry=arguments.get("return_geometry", True)
+        )
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+    def _make_dataset_info(self, *, name: str, url: str, svc_type: str,
+                           info: Dict[str, Any], folder: str = None,
+                           kind: str = "service") -> DatasetInfo:
+        """Build the canonical dataset record for a discovered service"""
+        short_name = name.split("/")[-1]
+        # svc_type, folder and the dataset id are drawn from small repeated
+        # vocabularies (and the id doubles as a hot dict key); interning
+        # collapses the parsed copies to one object and lets dict lookups
+        # take the pointer-equality shortcut
+        if folder:
+            folder = sys.intern(folder)
+        return DatasetInfo(
+            id=sys.intern(name.lower().replace("/", "_")),
+            name=name,
+            title=info.get("serviceDescription", short_name),
+            description=info.get("description", f"{short_name} {kind} from eThekwini municipality"),
+            type=sys.intern(svc_type),
+            url=url,
+            tags=_BASE_TAGS + ((folder,) if folder else ()),
+            categories=_BASE_CATEGORIES + ((folder,) if folder else ()),
+            service_info=info,
+            layers=info.get("layers", [])
+        )
+
+    def _load_disk_cache(self) -> bool:
+        """Rehydrate the dataset/service caches from the on-disk snapshot.
+        Returns True when a fresh-enough snapshot was loaded."""
+        try:
+            if time.time() - self._cache_path.stat().st_mtime >= self._cache_ttl:
+                return False
+            payload = orjson.loads(self._cache_path.read_bytes())
+            # Intern the ids and types on load so a snapshot round-trip ends
+            # up with the same shared strings a live refresh produces
+            datasets = {sys.intern(k): DatasetInfo(**dict(v, type=sys.intern(v["type"])))
+                        for k, v in payload["datasets"].items()}
+            services = {k: ServiceInfo(**v) for k, v in payload["services"].items()}
+        except (OSError, KeyError, TypeError, ValueError):
+            return False
+        self.cached_datasets = datasets
+        self.cached_services = services
+        self._resource_json_cache = {}
+        self._rebuild_search_index()
+        self.last_refresh = time.monotonic()
+        logger.info("Loaded %d datasets and %d services from disk cache",
+                    len(datasets), len(services))
+        return True
+
+    def _write_disk_cache(self):
+        """Persist the discovery results atomically (tempfile + os.replace)"""
+        try:
+            payload = orjson.dumps({
+                "datasets": {k: asdict(v) for k, v in self.cached_datasets.items()},
+                "services": {k: asdict(v) for k, v in self.cached_services.items()},
+            })
+            tmp = self._cache_path.with_suffix(".tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, self._cache_path)
+        except OSError as e:
+            logger.debug("Could not write dataset snapshot: %s", e)
+
+    def _rebuild_search_index(self):
+        """Rebuild the token/category posting sets and search blobs from the
+        current dataset cache"""
+        index: Dict[str, set] = {}
+        category_index: Dict[str, set] = {}
+        blobs: Dict[str, str] = {}
+        name_to_id: Dict[str, str] = {}
+        categories: Dict[str, List[str]] = {}
+        service_types: Dict[str, int] = {}
+        for dataset_id, info in self.cached_datasets.items():
+            blob = " ".join((info.name, info.title, info.description,
+                             " ".join(info.tags))).lower()
+            blobs[dataset_id] = blob
+            for token in _TOKEN_RE.findall(blob):
+                index.setdefault(token, set()).add(dataset_id)
+            for cat in info.categories:
+                category_index.setdefault(cat.lower(), set()).add(dataset_id)
+                categories.setdefault(cat, []).append(info.name)
+            name_to_id[info.name_lower] = dataset_id
+            name_to_id[info.title.lower()] = dataset_id
+            service_type = info.type or "Unknown"
+            service_types[service_type] = service_types.get(service_type, 0) + 1
+        self._index = index
+        self._category_index = category_index
+        self._search_blobs = blobs
+        self._name_to_id = name_to_id
+        self._categories = categories
+        self._service_types = service_types
+
     async def _refresh_datasets(self, force: bool = False):
-        """Discover and cache eThekwini GIS datasets"""
-        import time
-        
+        """Discover and cache eThekwini GIS datasets.
+
+        Concurrent callers piggyback on a single in-flight refresh task, so
+        N simultaneous tool calls at cache expiry cost one discovery pass."""
         # Skip refresh if recently done (unless forced)
-        if not force and self.last_refresh and (time.time() - self.last_refresh) < 900:  # 15 minutes
+        if not force and self.last_refresh and (time.monotonic() - self.last_refresh) < 900:  # 15 minutes
             return
-        
+
+        # A recent on-disk snapshot satisfies a cold start without touching
+        # the network; the refresh_datasets tool (force=True) bypasses it
+        if not force and not self.cached_datasets and self._load_disk_cache():
+            return
+
+        async with self._refresh_lock:
+            # Re-check under the lock: a refresh may have completed while
+            # this caller waited
+            if not force and self.last_refresh and (time.monotonic() - self.last_refresh) < 900:
+                return
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._do_refresh(force))
+            task = self._refresh_task
+        await task
+
+    async def _do_refresh(self, force: bool = False):
+        """Run one full discovery pass (always; gating lives in
+        _refresh_datasets)"""
         try:
             logger.info("Discovering eThekwini GIS services...")
-            
+
+            # Bind the hot attributes once: these are read per discovered
+            # service, and LOAD_FAST beats LOAD_ATTR across hundreds of
+            # loop iterations
+            client = self.client
+            api_base = self.api_base
+            get_info = self._get_service_info_limited
+            make_dataset = self._make_dataset_info
+
             all_datasets = {}
             all_services = {}
             
-            # Start with known services
-            for service_name, service_url in self.known_services.items():
-                try:
-                    service_info = await self._get_service_info(service_url)
-                    if service_info:
-                        dataset_info = {
-                            "id": service_name.lower(),
-                            "name": service_name,
-                            "title": service_info.get("serviceDescription", service_name),
-                            "description": service_info.get("description", f"{service_name} feature service from eThekwini municipality"),
-                            "type": "Feature Service",
-                            "url": service_url,
-                            "created": "",
-                            "updated": "",
-                            "tags": ["eThekwini", "municipality", "GIS"],
-                            "categories": ["Municipal Services"],
-                            "owner": {"name": "eThekwini Municipality"},
-                            "service_info": service_info,
-                            "layers": service_info.get("layers", [])
-                        }
-                        
-                        all_datasets[service_name.lower()] = dataset_info
-                        all_services[service_name] = {
-                            "name": service_name,
-                            "url": service_url,
-                            "type": "Feature Service",
-                            "dataset_id": service_name.lower(),
-                            "info": service_info
-                        }
-                        
-                        logger.info(f"Added service: {service_name} with {len(service_info.get('layers', []))} layers")
-                        
-                except Exception as e:
-                    logger.warning(f"Could not get info for service {service_name}: {e}")
+            # Start with known services, fetching their metadata concurrently
+            known_items = list(self.known_services.items())
+            known_infos = await asyncio.gather(
+                *[get_info(url, force=force) for _, url in known_items],
+                return_exceptions=True
+            )
+            for (service_name, service_url), service_info in zip(known_items, known_infos):
+                if isinstance(service_info, Exception):
+                    logger.warning("Could not get info for service %s: %s", service_name, service_info)
+                    continue
+                if service_info:
+                    dataset_info = make_dataset(
+                        name=service_name, url=service_url, svc_type=_TYPE_FEATURE_SERVICE,
+                        info=service_info, kind="feature service")
+
+                    all_datasets[service_name.lower()] = dataset_info
+                    all_services[service_name] = ServiceInfo(
+                        name=service_name,
+                        url=service_url,
+                        type=_TYPE_FEATURE_SERVICE,
+                        dataset_id=service_name.lower(),
+                        info=service_info
+                    )
+
+                    logger.info("Added service: %s with %d layers", service_name, len(service_info.get("layers", [])))
             
             # Try to discover more services from the main services endpoint
             try:
-                services_response = await self.client.get(f"{self.api_base}?f=json")
+                # Ask for the full catalog in one request; servers that honor
+                # option=full return folder-qualified service names inline,
+                # which replaces the per-folder listing round trips below
+                services_response = await client.get(f"{api_base}?f=json&option=full")
+                if services_response.status_code != 200:
+                    services_response = await client.get(f"{api_base}?f=json")
                 if services_response.status_code == 200:
-                    services_data = services_response.json()
-                    
-                    # Add root level services
+                    services_data = orjson.loads(services_response.content)
+
+                    # Split catalog entries into root and folder-qualified
+                    # services, fetching metadata concurrently
+                    root_candidates = []
+                    folder_candidates = []
                     for service in services_data.get("services", []):
                         service_name = service.get("name", "")
                         service_type = service.get("type", "")
-                        
-                        if service_type in ["FeatureServer", "MapServer"] and service_name not in self.known_services:
-                            service_url = f"{self.api_base}/{service_name}/{service_type}"
-                            
-                            try:
-                                service_info = await self._get_service_info(service_url)
-                                if service_info:
-                                    dataset_info = {
-                                        "id": service_name.lower(),
-                                        "name": service_name,
-                                        "title": service_info.get("serviceDescription", service_name),
-                                        "description": service_info.get("description", f"{service_name} service from eThekwini municipality"),
-                                        "type": service_type,
-                                        "url": service_url,
-                                        "created": "",
-                                        "updated": "",
-                                        "tags": ["eThekwini", "municipality", "GIS"],
-                                        "categories": ["Municipal Services"],
-                                        "owner": {"name": "eThekwini Municipality"},
-                                        "service_info": service_info,
-                                        "layers": service_info.get("layers", [])
-                                    }
-                                    
-                                    all_datasets[service_name.lower()] = dataset_info
-                                    all_services[service_name] = {
-                                        "name": service_name,
-                                        "url": service_url,
-                                        "type": service_type,
-                                        "dataset_id": service_name.lower(),
-                                        "info": service_info
-                                    }
-                                    
-                                    logger.info(f"Discovered service: {service_name} ({service_type})")
-                                    
-                            except Exception as e:
-                                logger.debug(f"Could not get info for discovered service {service_name}: {e}")
-                    
-                    # Add folder services
-                    for folder in services_data.get("folders", []):
-                        try:
-                            folder_response = await self.client.get(f"{self.api_base}/{folder}?f=json")
-                            if folder_response.status_code == 200:
-                                folder_data = folder_response.json()
-                                
-                                for service in folder_data.get("services", []):
-                                    service_name = service.get("name", "")
-                                    service_type = service.get("type", "")
-                                    full_service_name = f"{folder}/{service_name}"
-                                    
-                                    if service_type in ["FeatureServer", "MapServer"]:
-                                        service_url = f"{self.api_base}/{full_service_name}/{service_type}"
-                                        
-                                        try:
-                                            service_info = await self._get_service_info(service_url)
-                                            if service_info:
-                                                dataset_info = {
-                                                    "id": full_service_name.lower().replace("/", "_"),
-                                                    "name": full_service_name,
-                                                    "title": service_info.get("serviceDescription", service_name),
-                                                    "description": service_info.get("description", f"{service_name} service from eThekwini municipality"),
-                                                    "type": service_type,
-                                                    "url": service_url,
-                                                    "created": "",
-                                                    "updated": "",
-                                                    "tags": ["eThekwini", "municipality", "GIS", folder],
-                                                    "categories": ["Municipal Services", folder],
-                                                    "owner": {"name": "eThekwini Municipality"},
-                                                    "service_info": service_info,
-                                                    "layers": service_info.get("layers", [])
-                                                }
-                                                
-                                                all_datasets[full_service_name.lower().replace("/", "_")] = dataset_info
-                                                all_services[full_service_name] = {
-                                                    "name": full_service_name,
-                                                    "url": service_url,
-                                                    "type": service_type,
-                                                    "dataset_id": full_service_name.lower().replace("/", "_"),
-                                                    "info": service_info
-                                                }
-                                                
-                                                logger.info(f"Discovered folder service: {full_service_name} ({service_type})")
-                                                
-                                        except Exception as e:
-                                            logger.debug(f"Could not get info for folder service {full_service_name}: {e}")
-                        except Exception as e:
-                            logger.debug(f"Could not process folder {folder}: {e}")
+
+                        if service_type not in ["FeatureServer", "MapServer"]:
+                            continue
+                        if "/" in service_name:
+                            folder, short_name = service_name.split("/", 1)
+                            service_url = f"{api_base}/{service_name}/{service_type}"
+                            folder_candidates.append(
+                                (folder, short_name, service_name, service_type, service_url))
+                        elif service_name not in self.known_services:
+                            service_url = f"{api_base}/{service_name}/{service_type}"
+                            root_candidates.append((service_name, service_type, service_url))
+
+                    # Build records straight from the catalog entries: the
+                    # listing already carries name and type, and the full
+                    # per-service metadata is fetched lazily on first use
+                    # (_hydrate_dataset), so a refresh costs one or two
+                    # catalog requests instead of one GET per service
+                    for service_name, service_type, service_url in root_candidates:
+                        dataset_info = make_dataset(
+                            name=service_name, url=service_url,
+                            svc_type=service_type, info={})
+
+                        all_datasets[service_name.lower()] = dataset_info
+                        all_services[service_name] = ServiceInfo(
+                            name=service_name,
+                            url=service_url,
+                            type=service_type,
+                            dataset_id=service_name.lower(),
+                            info={}
+                        )
+
+                        logger.info("Discovered service: %s (%s)", service_name, service_type)
+
+
+                    # Add folder services. If the batched catalog call already
+                    # listed them there is nothing left to walk; otherwise list
+                    # all folders concurrently, then fetch every discovered
+                    # service's metadata in one gather
+                    folders = [] if folder_candidates else services_data.get("folders", [])
+                    folder_listings = await asyncio.gather(
+                        *[self._get_folder_listing(folder) for folder in folders]
+                    )
+
+                    for folder, folder_data in zip(folders, folder_listings):
+                        if not folder_data:
+                            continue
+                        for service in folder_data.get("services", []):
+                            service_name = service.get("name", "")
+                            service_type = service.get("type", "")
+
+                            if service_type in ["FeatureServer", "MapServer"]:
+                                full_service_name = f"{folder}/{service_name}"
+                                service_url = f"{api_base}/{full_service_name}/{service_type}"
+                                folder_candidates.append(
+                                    (folder, service_name, full_service_name, service_type, service_url))
+
+                    for folder, service_name, full_service_name, service_type, service_url in folder_candidates:
+                        dataset_info = make_dataset(
+                            name=full_service_name, url=service_url,
+                            svc_type=service_type, info={},
+                            folder=folder)
+
+                        all_datasets[full_service_name.lower().replace("/", "_")] = dataset_info
+                        all_services[full_service_name] = ServiceInfo(
+                            name=full_service_name,
+                            url=service_url,
+                            type=service_type,
+                            dataset_id=full_service_name.lower().replace("/", "_"),
+                            info={}
+                        )
+
+                        logger.info("Discovered folder service: %s (%s)", full_service_name, service_type)
                             
             except Exception as e:
-                logger.warning(f"Could not discover additional services: {e}")
+                logger.warning("Could not discover additional services: %s", e)
             
             self.cached_datasets = all_datasets
             self.cached_services = all_services
-            self.last_refresh = time.time()
+            self._resource_json_cache = {}
+            self._rebuild_search_index()
+            self.last_refresh = time.monotonic()
             
-            logger.info(f"Discovered {len(all_datasets)} datasets and {len(all_services)} services")
+            logger.info("Discovered %d datasets and %d services", len(all_datasets), len(all_services))
+            self._write_disk_cache()
             
         except Exception as e:
-            logger.error(f"Error refreshing datasets: {e}")
+            logger.error("Error refreshing datasets: %s", e)
             # Don't raise, allow fallback to cached data
     
-    async def _search_datasets(self, query: str = "", category: str = None, limit: int = 20) -> List[Dict]:
+    async def _search_datasets(self, query: str = "", category: str = None, limit: int = 20) -> List[DatasetInfo]:
         """Search datasets by query and category"""
         await self._refresh_datasets()
-        
-        results = []
+
         query_lower = query.lower() if query else ""
-        
-        for dataset_id, dataset_info in self.cached_datasets.items():
-            # Check if dataset matches search criteria
-            matches = True
-            
-            if query:
-                searchable_text = " ".join([
-                    dataset_info.get("name", ""),
-                    dataset_info.get("title", ""),
-                    dataset_info.get("description", ""),
-                    " ".join(dataset_info.get("tags", []))
-                ]).lower()
-                
-                if query_lower not in searchable_text:
-                    matches = False
-            
-            if category and matches:
-                dataset_categories = [cat.lower() for cat in dataset_info.get("categories", [])]
-                if category.lower() not in dataset_categories:
-                    matches = False
-            
-            if matches:
-                results.append(dataset_info)
-                if len(results) >= limit:
-                    break
-        
-        return results
-    
-    async def _get_dataset_info(self, dataset_id: str) -> Dict[str, Any]:
+        cat_ids = self._category_index.get(category.lower(), set()) if category else None
+
+        # Fast path: when every query token has a posting set, intersect them
+        # and only substring-verify the handful of candidates. A token absent
+        # from the index can still match as a partial word (e.g. "road" in
+        # "roads"), so that case falls back to the full scan.
+        candidate_ids = None
+        if query_lower:
+            tokens = _TOKEN_RE.findall(query_lower)
+            if tokens:
+                postings = [self._index.get(token) for token in tokens]
+                if all(postings):
+                    candidate_ids = set.intersection(*postings)
+
+        if candidate_ids is not None:
+            items = ((dataset_id, self.cached_datasets[dataset_id])
+                     for dataset_id in candidate_ids
+                     if dataset_id in self.cached_datasets)
+        else:
+            items = self.cached_datasets.items()
+
+        blobs = self._search_blobs
+        return list(islice(
+            (dataset_info for dataset_id, dataset_info in items
+             if (not query_lower or query_lower in blobs.get(dataset_id, ""))
+             and (cat_ids is None or dataset_id in cat_ids)),
+            limit))
+
+    async def _get_dataset_info(self, dataset_id: str) -> DatasetInfo:
         """Get detailed information about a dataset"""
         await self._refresh_datasets()
-        
+
         # Try by ID first
         if dataset_id in self.cached_datasets:
-            return self.cached_datasets[dataset_id]
-        
-        # Try by name
-        for cached_id, dataset_info in self.cached_datasets.items():
-            if (dataset_info.get("name", "").lower() == dataset_id.lower() or 
-                dataset_info.get("title", "").lower() == dataset_id.lower()):
-                return dataset_info
-        
+            return await self._hydrate_dataset(self.cached_datasets[dataset_id])
+
+        # Try by name or title via the precomputed lowercase map
+        cached_id = self._name_to_id.get(dataset_id.lower())
+        if cached_id is not None:
+            return await self._hydrate_dataset(self.cached_datasets[cached_id])
+
         raise ValueError(f"Dataset not found: {dataset_id}")
+
+    async def _hydrate_dataset(self, dataset_info: DatasetInfo) -> DatasetInfo:
+        """Fetch the full service metadata for a catalog-discovered record on
+        first use and fold it into the cached entry. Records that already
+        carry their metadata pass through untouched."""
+        if dataset_info.service_info:
+            return dataset_info
+        info = await self._get_service_info_limited(dataset_info.url)
+        if info:
+            dataset_info.service_info = info
+            dataset_info.layers = info.get("layers", [])
+            dataset_info.title = info.get("serviceDescription") or dataset_info.title
+            dataset_info.description = info.get("description") or dataset_info.description
+            # The previously serialized body no longer matches
+            self._resource_json_cache.pop(("dataset", dataset_info.id), None)
+            service = self.cached_services.get(dataset_info.name)
+            if service is not None:
+                service.info = info
+        return dataset_info
     
     async def _query_feature_layer(self, service_url: str, layer_id: int = 0,
                                  where: str = "1=1", geometry: str = None,
                                  spatial_rel: str = "esriSpatialRelIntersects",
                                  return_geometry: bool = True, max_records: int = 100,
-                                 out_fields: str = "*") -> Dict[str, Any]:
-        """Query features from a feature layer"""
-        
+                                 out_fields: str = "*",
+                                 extra: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Query features from a feature layer. `extra` is merged into the
+        request parameters, e.g. a resultOffset window from _query_all."""
+
         # Construct query URL
         if not service_url.endswith('/'):
             service_url += '/'
         query_url = f"{service_url}{layer_id}/query"
-        
+
         params = {
             "where": where,
             "outFields": out_fields,
@@ -717,16 +1047,138 @@ class EThekwiniGISServer:
             "resultRecordCount": max_records,
             "spatialRel": spatial_rel
         }
+        if extra:
+            params.update(extra)
         
         if geometry:
-            params["geometry"] = geometry
-            params["geometryType"] = "esriGeometryPolygon"  # Assume polygon, adjust as needed
-        
-        response = await self.client.get(query_url, params=params)
-        response.raise_for_status()
-        
-        return response.json()
-    
+            # WKT input gets parsed by GEOS and sent as typed esri JSON;
+            # anything else (esri JSON, bare coordinates) passes through with
+            # the old polygon assumption
+            converted = _wkt_to_esri(geometry) if _WKT_RE.match(geometry) else None
+            if converted:
+                esri_geom, esri_type = converted
+                params["geometry"] = orjson.dumps(esri_geom).decode()
+                params["geometryType"] = esri_type
+            else:
+                params["geometry"] = geometry
+                params["geometryType"] = "esriGeometryPolygon"  # Assume polygon, adjust as needed
+
+        # Stream the body and hand the raw bytes straight to orjson: feature
+        # responses run to megabytes, and this skips one full buffer copy
+        # versus response.content on a plain GET
+        async with self.client.stream("GET", query_url, params=params) as response:
+            response.raise_for_status()
+            content = await response.aread()
+        data = orjson.loads(content)
+
+        # The server caps each response at its own maxRecordCount and sets
+        # exceededTransferLimit on truncation; page the remainder with
+        # parallel resultOffset windows instead of silently dropping data
+        features = data.get("features")
+        if features and data.get("exceededTransferLimit") and len(features) < max_records:
+            page_size = len(features)
+            # A caller may have injected an absolute resultOffset via extra
+            # (a _query_all window); continuation pages must advance from it,
+            # not restart at the front of the layer
+            base_offset = int(params.get("resultOffset", 0))
+            offsets = range(page_size, max_records, page_size)
+            semaphore = asyncio.Semaphore(6)
+
+            async def _fetch_page(offset: int) -> Dict[str, Any]:
+                async with semaphore:
+                    page_params = dict(params, resultOffset=base_offset + offset,
+                                       resultRecordCount=min(page_size, max_records - offset))
+                    page_response = await self.client.get(query_url, params=page_params)
+                    page_response.raise_for_status()
+                    return orjson.loads(page_response.content)
+
+            pages = await asyncio.gather(*[_fetch_page(offset) for offset in offsets])
+            for page in pages:
+                features.extend(page.get("features", []))
+            data["exceededTransferLimit"] = bool(pages[-1].get("exceededTransferLimit"))
+
+        return data
+
+    async def _query_all(self, service_url: str, layer_id: int = 0,
+                         where: str = "1=1", geometry: str = None,
+                         spatial_rel: str = "esriSpatialRelIntersects",
+                         return_geometry: bool = True, out_fields: str = "*",
+                         page_size: int = 1000) -> Dict[str, Any]:
+        """Fetch every feature matching the filter: one returnCountOnly
+        request sizes the result, then all resultOffset windows are pulled
+        concurrently instead of paging serially"""
+        # The count probe goes through _query_feature_layer so spatial
+        # filters (including WKT conversion) constrain the count too
+        count_data = await self._query_feature_layer(
+            service_url, layer_id, where=where, geometry=geometry,
+            spatial_rel=spatial_rel, extra={"returnCountOnly": "true"})
+        if "count" not in count_data:
+            # Older servers reject returnCountOnly/resultOffset; fall back to
+            # the object-ID windowing pattern, which every version supports
+            return await self._query_paged_by_ids(
+                service_url, layer_id, where=where, geometry=geometry,
+                spatial_rel=spatial_rel, return_geometry=return_geometry,
+                out_fields=out_fields, batch=page_size)
+        total = count_data["count"]
+        if not total:
+            return {"count": 0, "features": []}
+
+        pages = await asyncio.gather(*[
+            self._query_feature_layer(service_url, layer_id, where=where,
+                                      geometry=geometry, spatial_rel=spatial_rel,
+                                      return_geometry=return_geometry,
+                                      out_fields=out_fields,
+                                      max_records=page_size,
+                                      extra={"resultOffset": offset})
+            for offset in range(0, total, page_size)
+        ])
+        result = pages[0]
+        features = result.get("features", [])
+        for page in pages[1:]:
+            features.extend(page.get("features", []))
+        result["features"] = features
+        result["count"] = total
+        result.pop("exceededTransferLimit", None)
+        return result
+
+    async def _query_paged_by_ids(self, service_url: str, layer_id: int = 0,
+                                  where: str = "1=1", geometry: str = None,
+                                  spatial_rel: str = "esriSpatialRelIntersects",
+                                  return_geometry: bool = True,
+                                  out_fields: str = "*",
+                                  batch: int = 1000) -> Dict[str, Any]:
+        """Fetch every matching feature via object-ID windows: one cheap
+        returnIdsOnly request enumerates the matches, then the IDs are pulled
+        in parallel batches. Works on servers that predate resultOffset
+        pagination, and sidesteps the per-response maxRecordCount cap."""
+        # Enumerate IDs through _query_feature_layer so the where clause and
+        # any spatial filter both constrain the ID set
+        id_data = await self._query_feature_layer(
+            service_url, layer_id, where=where, geometry=geometry,
+            spatial_rel=spatial_rel, extra={"returnIdsOnly": "true"})
+        object_ids = id_data.get("objectIds") or []
+        if not object_ids:
+            return {"count": 0, "features": []}
+
+        # The ID lists already pin down each batch, so the filters don't
+        # need to be re-sent with the feature fetches
+        pages = await asyncio.gather(*[
+            self._query_feature_layer(service_url, layer_id,
+                                      max_records=batch, out_fields=out_fields,
+                                      return_geometry=return_geometry,
+                                      extra={"objectIds": ",".join(
+                                          map(str, object_ids[start:start + batch]))})
+            for start in range(0, len(object_ids), batch)
+        ])
+        result = pages[0]
+        features = result.get("features", [])
+        for page in pages[1:]:
+            features.extend(page.get("features", []))
+        result["features"] = features
+        result["count"] = len(object_ids)
+        result.pop("exceededTransferLimit", None)
+        return result
+
     async def _get_layer_statistics(self, service_url: str, layer_id: int = 0,
                                   field_name: str = "", statistic_type: str = "count",
                                   where: str = "1=1") -> Dict[str, Any]:
@@ -744,94 +1196,161 @@ class EThekwiniGISServer:
         
         params = {
             "where": where,
-            "outStatistics": json.dumps(out_statistics),
+            "outStatistics": orjson.dumps(out_statistics).decode(),
             "f": "json"
         }
-        
-        response = await self.client.get(query_url, params=params)
-        response.raise_for_status()
-        
-        return response.json()
+
+        async with self.client.stream("GET", query_url, params=params) as response:
+            response.raise_for_status()
+            content = await response.aread()
+        return orjson.loads(content)
     
-    async def _get_service_info(self, service_url: str) -> Dict[str, Any]:
-        """Get information about a service"""
+    async def _fetch_json(self, url: str) -> Optional[Dict[str, Any]]:
+        """GET a ?f=json document under the discovery concurrency cap"""
+        async with self._discovery_semaphore:
+            response = await self.client.get(url, params={"f": "json"})
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            return None
+
+    async def _get_folder_listing(self, folder: str) -> Optional[Dict[str, Any]]:
+        """Fetch one folder's service listing, or None on failure"""
+        try:
+            return await self._fetch_json(f"{self.api_base}/{folder}")
+        except Exception as e:
+            logger.debug("Could not process folder %s: %s", folder, e)
+        return None
+
+    async def _get_service_info_limited(self, service_url: str, force: bool = False) -> Dict[str, Any]:
+        """Fetch service info under the discovery concurrency cap"""
+        async with self._discovery_semaphore:
+            return await self._get_service_info(service_url, force=force)
+
+    async def _get_service_info(self, service_url: str, force: bool = False) -> Dict[str, Any]:
+        """Get information about a service (TTL-cached per URL, revalidated
+        with conditional GETs once the TTL expires).
+
+        Concurrent callers asking for the same URL are coalesced onto a
+        single in-flight request, so duplicate tool calls cost one round
+        trip instead of N."""
+        cached = self._svc_cache.get(service_url)
+        if not force and cached and (time.monotonic() - cached[0]) < self._svc_cache_ttl:
+            # Reinsert on hit so eviction below tracks recency, not insertion
+            self._svc_cache[service_url] = self._svc_cache.pop(service_url)
+            return cached[1]
+
+        inflight = self._inflight.get(service_url)
+        if inflight is not None:
+            return await inflight
+
+        task = asyncio.ensure_future(self._fetch_service_info(service_url))
+        self._inflight[service_url] = task
+        try:
+            return await task
+        finally:
+            self._inflight.pop(service_url, None)
+
+    async def _fetch_service_info(self, service_url: str) -> Dict[str, Any]:
+        """Perform the actual (conditional) service-info GET"""
+        cached = self._svc_cache.get(service_url)
         try:
             params = {"f": "json"}
-            response = await self.client.get(service_url, params=params, timeout=10.0)
-            
+            headers = {}
+            if cached:
+                # Revalidate instead of re-downloading: a 304 costs headers only
+                _, _, etag, last_modified = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+
+            response = await self.client.get(service_url, params=params,
+                                             headers=headers, timeout=10.0)
+
+            if response.status_code == 304 and cached:
+                # Unchanged upstream: reuse the cached body and restart the TTL
+                self._svc_cache[service_url] = (time.monotonic(),) + cached[1:]
+                return cached[1]
             if response.status_code == 200:
-                return response.json()
-            else:
-                return None
+                data = orjson.loads(response.content)
+                if service_url not in self._svc_cache and \
+                        len(self._svc_cache) >= self._metadata_cache_max:
+                    self._svc_cache.pop(next(iter(self._svc_cache)))
+                self._svc_cache[service_url] = (
+                    time.monotonic(),
+                    data,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
+                return data
+            return None
         except Exception:
             return None
     
     async def _list_municipal_services(self) -> Dict[str, Any]:
         """List municipal service categories available in the data"""
         await self._refresh_datasets()
-        
-        categories = {}
-        service_types = {}
-        
-        for dataset_id, dataset_info in self.cached_datasets.items():
-            # Collect categories
-            for category in dataset_info.get("categories", []):
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(dataset_info["name"])
-            
-            # Collect service types
-            service_type = dataset_info.get("type", "Unknown")
-            if service_type not in service_types:
-                service_types[service_type] = 0
-            service_types[service_type] += 1
-        
+
+        # The aggregates are materialized by _rebuild_search_index, so this
+        # is a constant-time assembly rather than a scan of every dataset
         return {
-            "categories": categories,
-            "service_types": service_types,
+            "categories": self._categories,
+            "service_types": self._service_types,
             "total_datasets": len(self.cached_datasets),
             "total_services": len(self.cached_services)
         }
     
-    async def _get_layer_fields(self, service_url: str, layer_id: int = 0) -> Dict[str, Any]:
+    async def _get_layer_fields(self, service_url: str, layer_id: int = 0,
+                                force: bool = False) -> Dict[str, Any]:
         """Get field information for a feature layer"""
-        
+
+        cache_key = (service_url, layer_id)
+        cached = self._layer_fields_cache.get(cache_key)
+        if not force and cached and \
+                (time.monotonic() - cached[0]) < self._layer_fields_ttl:
+            self._layer_fields_cache[cache_key] = self._layer_fields_cache.pop(cache_key)
+            return cached[1]
+
         if not service_url.endswith('/'):
             service_url += '/'
         layer_url = f"{service_url}{layer_id}"
-        
+
         params = {"f": "json"}
-        
-        response = await self.client.get(layer_url, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract field information
+
+        async with self.client.stream("GET", layer_url, params=params) as response:
+            response.raise_for_status()
+            content = await response.aread()
+        data = orjson.loads(content)
+
+        # Extract field information; built as one comprehension so wide
+        # layers (50+ fields) don't pay per-append overhead
         fields_info = {
             "layer_name": data.get("name", ""),
             "layer_description": data.get("description", ""),
             "geometry_type": data.get("geometryType", ""),
-            "fields": []
-        }
-        
-        for field in data.get("fields", []):
-            fields_info["fields"].append({
+            "fields": [{
                 "name": field.get("name", ""),
                 "type": field.get("type", ""),
                 "alias": field.get("alias", ""),
                 "length": field.get("length"),
                 "nullable": field.get("nullable", True),
                 "editable": field.get("editable", False)
-            })
-        
+            } for field in data.get("fields", ())]
+        }
+
+        if cache_key not in self._layer_fields_cache and \
+                len(self._layer_fields_cache) >= self._metadata_cache_max:
+            self._layer_fields_cache.pop(next(iter(self._layer_fields_cache)))
+        self._layer_fields_cache[cache_key] = (time.monotonic(), fields_info)
         return fields_info
     
     async def _spatial_query_by_coordinates(self, service_url: str, layer_id: int = 0,
                                           xmin: float = 0, ymin: float = 0,
                                           xmax: float = 0, ymax: float = 0,
                                           buffer_distance: float = None,
-                                          max_records: int = 100) -> Dict[str, Any]:
+                                          max_records: int = 100,
+                                          out_fields: str = "*",
+                                          return_geometry: bool = True) -> Dict[str, Any]:
         """Query features within a bounding box or buffer around coordinates"""
         
         if not service_url.endswith('/'):
@@ -848,12 +1367,12 @@ class EThekwiniGISServer:
         }
         
         params = {
-            "geometry": json.dumps(geometry),
+            "geometry": orjson.dumps(geometry).decode(),
             "geometryType": "esriGeometryEnvelope",
             "spatialRel": "esriSpatialRelIntersects",
             "where": "1=1",
-            "outFields": "*",
-            "returnGeometry": "true",
+            "outFields": out_fields,
+            "returnGeometry": str(return_geometry).lower(),
             "f": "json",
             "resultRecordCount": max_records
         }
@@ -862,11 +1381,11 @@ class EThekwiniGISServer:
         if buffer_distance:
             params["distance"] = buffer_distance
             params["units"] = "esriSRUnit_Meter"
-        
-        response = await self.client.get(query_url, params=params)
-        response.raise_for_status()
-        
-        return response.json()
+
+        async with self.client.stream("GET", query_url, params=params) as response:
+            response.raise_for_status()
+            content = await response.aread()
+        return orjson.loads(content)
     
     async def _add_known_service(self, service_name: str, service_url: str) -> str:
         """Add a known service to the server and refresh datasets"""
@@ -882,50 +1401,84 @@ class EThekwiniGISServer:
         except Exception as e:
             return f"Error adding service '{service_name}': {str(e)}"
     
-    async def _query_leases_dataset(self, where: str = "1=1", layer_id: int = 11, 
-                                  format: str = "geojson", max_records: int = 100) -> Dict[str, Any]:
+    async def _query_leases_dataset(self, where: str = "1=1", layer_id: int = 11,
+                                  format: str = "geojson", max_records: int = 100,
+                                  out_fields: str = "*",
+                                  return_geometry: bool = True) -> Dict[str, Any]:
         """Query the eThekwini Leases dataset"""
-        
-        leases_url = "https://services3.arcgis.com/HO0zfySJshlD6Twu/arcgis/rest/services/Leases/FeatureServer"
-        query_url = f"{leases_url}/{layer_id}/query"
-        
+
+        query_url = f"{self._leases_base}/{layer_id}/query"
+
+        # Lease polygons dominate the payload; attribute-only callers skip
+        # them entirely and drop to the lighter plain-json format
+        if not return_geometry:
+            format = "json"
+
         params = {
             "where": where,
-            "outFields": "*",
+            "outFields": out_fields,
             "f": format,
             "resultRecordCount": max_records
         }
-        
+
         # Add geometry parameter for geojson format
-        if format.lower() == "geojson":
+        if return_geometry and format.lower() == "geojson":
             params["returnGeometry"] = "true"
-        
-        response = await self.client.get(query_url, params=params)
-        response.raise_for_status()
-        
-        if format.lower() == "geojson":
-            return response.json()
-        else:
-            return response.json()
+        elif not return_geometry:
+            params["returnGeometry"] = "false"
+
+        async with self.client.stream("GET", query_url, params=params) as response:
+            response.raise_for_status()
+            content = await response.aread()
+        return orjson.loads(content)
     
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _refresh_loop(self):
+        """Keep the dataset cache warm off the request path"""
+        while True:
+            try:
+                await self._refresh_datasets()
+            except Exception as e:
+                logger.warning("Background refresh failed: %s", e)
+            await asyncio.sleep(900)
+
     async def run(self):
         """Run the MCP server"""
-        # Initial dataset discovery
-        await self._refresh_datasets()
-        
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="ethekwini-gis-mcp",
-                    server_version="1.0.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=None,
-                        experimental_capabilities=None,
+        refresh_task = None
+        try:
+            # Initial discovery and periodic re-discovery both run in the
+            # background, so tool calls never wait out a full refresh;
+            # handlers still hit _refresh_datasets, which is a no-op while
+            # the cache is fresh and piggybacks on this task otherwise
+            refresh_task = asyncio.create_task(self._refresh_loop())
+
+            async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="ethekwini-gis-mcp",
+                        server_version="1.0.0",
+                        capabilities=self.server.get_capabilities(
+                            notification_options=None,
+                            experimental_capabilities=None,
+                        ),
                     ),
-                ),
-            )
+                )
+        finally:
+            if refresh_task is not None:
+                refresh_task.cancel()
+            # Drain the keepalive pool cleanly on shutdown
+            await self.aclose()
 
 async def main():
     """Main entry point"""